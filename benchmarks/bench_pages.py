@@ -0,0 +1,372 @@
+"""
+Benchmark pentru paginile aplicației, rulate fără browser prin streamlit.testing.v1.AppTest, pe fișierele
+data/*.xlsx din proiect.
+
+Fiecare pagină este măsurată în --rounds procese separate (implicit 3), ca memoria și cache-urile să nu
+se amestece; pentru fiecare timp se păstrează cel mai bun dintre procese, pentru memorie mediana:
+    rece      – prima rulare, cu cache-urile din memorie goale (datasets, kpi_cards, st.cache_data);
+                importurile pandas și plotly sunt făcute înainte, ca în serverul aplicației
+    cald      – rerulări fără nicio schimbare (cea mai bună și mediana din --repeat)
+    interacț. – câte o rerulare pentru fiecare valoare aleasă din selectoarele din bara laterală
+                (până la --options valori per selector, distribuite pe toată lista), apoi revenirea la
+                valoarea inițială; sunt raportate mediana și maximul
+    RSS       – memoria maximă a procesului (ru_maxrss) după toate rulările și cât a adăugat pagina
+                peste procesul gol, cu bibliotecile deja importate
+
+Cache-ul Parquet din data/.cache rămâne folosit; cu --no-disk-cache rularea rece citește și
+fișierele Excel, dintr-un cache temporar gol.
+
+Rulare, din rădăcina proiectului:
+    python -m benchmarks.bench_pages [--rounds 3] [--repeat 5] [--options 3] [--json rezultate.json] [Real Social ...]
+
+Referința (benchmarks/baseline_pages.json, sau --baseline) nu păstrează timpi absoluți, care depind de
+mașină: fiecare proces rulează, intercalat cu rerulările calde, un calcul fix de calibrare (pandas + plotly,
+fără codul aplicației), iar timpii paginilor sunt păstrați și comparați ca multipli ai medianei calibrărilor
+tuturor proceselor (timpul calibrării variază de la un proces la altul). Memoria este
+comparată ca RSS adăugat de pagină. Astfel, referința salvată pe o mașină poate fi verificată și pe alta
+(CI, laptopul altui dezvoltator). Sunt comparate doar măsurătorile stabile din BASELINE_METRICS; scriptul
+se termină cu cod 1 dacă una este mai slabă decât referința cu mai mult de --tolerance (implicit 30%;
+--cold-tolerance, implicit 60%, pentru rularea rece, o singură măsurătoare per proces) plus MIN_SLACK,
+sau dacă o pagină aruncă o excepție. --save-baseline rescrie referința, după o schimbare
+de performanță intenționată. Pe mașini partajate, cu timpi foarte variabili, măriți --rounds sau --tolerance.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PAGES = ["Main", "Real", "Indicatori_Macro", "Monetar", "Public", "Social", "Prognoza"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline_pages.json")
+
+# Coloanele tabelului afișat
+METRICS = [
+    ("rece_ms", "rece"),
+    ("cald_ms", "cald"),
+    ("cald_median_ms", "cald med."),
+    ("interactiune_median_ms", "interacț. med."),
+    ("interactiune_max_ms", "interacț. max"),
+    ("rss_pagina_mb", "RSS pag. MB"),
+    ("calibrare_ms", "calibrare"),
+]
+
+# Măsurătorile păstrate în referință: (cheia din rezultat, cheia din referință, este timp)
+# Timpii intră în referință ca multipli ai calibrării. Mediana rerulărilor calde și maximul interacțiunilor
+# sunt afișate, dar nu comparate: variază prea mult de la o rulare la alta.
+BASELINE_METRICS = [
+    ("rece_ms", "rece", True),
+    ("cald_ms", "cald", True),
+    ("interactiune_median_ms", "interactiune_median", True),
+    ("rss_pagina_mb", "rss_pagina_mb", False),
+]
+
+BASELINE_UNITS = "timpi: multipli ai calculului de calibrare din bench_pages.py; rss_pagina_mb: MB"
+
+_TIME_KEYS = ["rece_ms", "cald_ms", "cald_median_ms", "interactiune_median_ms", "interactiune_max_ms"]
+
+# Diferențele de timp sub această fracție din calibrare nu sunt regresii (ex. rerulările de câteva ms)
+MIN_SLACK = 0.15
+
+# Dimensiunea și repetările calculului de calibrare
+CALIBRATION_ROWS = 200_000
+CALIBRATION_REPEAT = 7
+
+# Variabile de mediu care ar porni lucruri străine de pagină (actualizarea periodică, jurnalul de profilare)
+_IGNORED_ENV = ("INDICATORI_REFRESH_INTERVAL", "DASHBOARD_PROFILING", "DASHBOARD_PROFILING_MEMORY")
+
+_TIMEOUT = 300
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss este în KB pe Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def _failures(at):
+    # Doar excepțiile: st.error este folosit de pagini și pentru perioade fără date
+    return [e.message for e in at.exception]
+
+
+def _timed_run(at, widget=None, value=None):
+    start = time.perf_counter()
+    if widget is None:
+        at.run(timeout=_TIMEOUT)
+    else:
+        widget.set_value(value).run(timeout=_TIMEOUT)
+    return (time.perf_counter() - start) * 1000
+
+
+def _spread(options, current, count):
+    """Până la `count` opțiuni diferite de cea curentă, distribuite uniform pe listă."""
+    candidates = [option for option in options if option != current]
+    if len(candidates) <= count:
+        return candidates
+    step = (len(candidates) - 1) / max(count - 1, 1)
+    return [candidates[round(i * step)] for i in range(count)]
+
+
+def _sidebar_widget(at, kind, label):
+    for widget in getattr(at.sidebar, kind):
+        if widget.label == label:
+            return widget
+    return None
+
+
+def _interactions(at, options_per_widget):
+    """Rerulările pentru selectoarele din bara laterală: [(selector, valoare, ms, erori)]."""
+    measured = []
+    controls = [(kind, widget.label) for kind in ("selectbox", "radio") for widget in getattr(at.sidebar, kind)]
+    for kind, label in controls:
+        widget = _sidebar_widget(at, kind, label)
+        if widget is None:
+            # Selectorul depinde de altul și nu mai este afișat
+            continue
+        initial = widget.value
+        for value in _spread(list(widget.options), str(initial), options_per_widget):
+            widget = _sidebar_widget(at, kind, label)
+            if widget is None or value not in widget.options:
+                break
+            ms = _timed_run(at, widget, value)
+            measured.append((label, value, ms, _failures(at)))
+        widget = _sidebar_widget(at, kind, label)
+        if widget is not None and widget.value != initial:
+            widget.set_value(initial).run(timeout=_TIMEOUT)
+    return measured
+
+
+def measure_page(page, repeat, options_per_widget, no_disk_cache):
+    """Măsurătorile unei pagini, în procesul curent (apelat de --worker)."""
+    for name in _IGNORED_ENV:
+        os.environ.pop(name, None)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    # Bibliotecile comune tuturor paginilor sunt deja încărcate în serverul aplicației
+    import pandas  # noqa: F401
+    import plotly.express  # noqa: F401
+    from streamlit.testing.v1 import AppTest
+    from utils import excel_cache
+
+    # Încălzirea calibrării, înainte de măsurarea memoriei: vârful ei nu este atribuit paginii
+    calibration_workload()
+    rss_start = _peak_rss_mb()
+
+    with contextlib.ExitStack() as stack:
+        if no_disk_cache:
+            excel_cache.CACHE_DIR = stack.enter_context(tempfile.TemporaryDirectory())
+
+        at = AppTest.from_file(os.path.join(ROOT, "pages", f"{page}.py"), default_timeout=_TIMEOUT)
+        cold = _timed_run(at)
+        errors = _failures(at)
+        warm, calibration = [], []
+        for _ in range(repeat):
+            warm.append(_timed_run(at))
+            # Calibrarea este intercalată cu rerulările, ca să prindă aceeași încărcare a mașinii
+            calibration.append(_timed_calibration())
+        errors += _failures(at)
+        interactions = _interactions(at, options_per_widget) if not errors else []
+
+    interaction_ms = [ms for _, _, ms, _ in interactions]
+    rss = _peak_rss_mb()
+    calibration += [_timed_calibration() for _ in range(CALIBRATION_REPEAT)]
+    return {
+        "calibrare_ms": round(min(calibration), 2),
+        "rece_ms": round(cold, 1),
+        "cald_ms": round(min(warm), 1),
+        "cald_median_ms": round(statistics.median(warm), 1),
+        "interactiune_median_ms": round(statistics.median(interaction_ms), 1) if interaction_ms else None,
+        "interactiune_max_ms": round(max(interaction_ms), 1) if interaction_ms else None,
+        "rss_mb": rss,
+        "rss_pagina_mb": round(rss - rss_start, 1) if rss is not None else None,
+        "interactiuni": [
+            {"selector": label, "valoare": str(value), "ms": round(ms, 1)}
+            for label, value, ms, _ in interactions
+        ],
+        "erori": errors + [f"{label} = {value}: {error}" for label, value, _, failed in interactions for error in failed],
+    }
+
+
+def calibration_workload():
+    """Calculul fix de calibrare: o agregare pandas și o figură plotly serializată, ca într-o rerulare de pagină."""
+    import pandas as pd
+    import plotly.express as px
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "an": rng.integers(2000, 2025, CALIBRATION_ROWS),
+        "tara": rng.integers(0, 200, CALIBRATION_ROWS),
+        "valoare": rng.random(CALIBRATION_ROWS),
+    })
+    pivot = df.groupby(["an", "tara"])["valoare"].sum().unstack()
+    px.line(pivot.iloc[:, :20]).to_json()
+
+
+def _timed_calibration():
+    start = time.perf_counter()
+    calibration_workload()
+    return (time.perf_counter() - start) * 1000
+
+
+def run_worker(page, args):
+    """Rulează măsurătorile unei pagini într-un proces nou și întoarce rezultatul."""
+    command = [
+        sys.executable, "-m", "benchmarks.bench_pages", "--worker", page,
+        "--repeat", str(args.repeat), "--options", str(args.options),
+    ]
+    if args.no_disk_cache:
+        command.append("--no-disk-cache")
+    completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, encoding="utf-8")
+    if completed.returncode != 0:
+        raise RuntimeError(f"{page}: procesul de măsurare a eșuat\n{completed.stderr[-2000:]}")
+    # Ultima linie din stdout este rezultatul; paginile pot scrie și ele în stdout
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def combine_rounds(rounds):
+    """Rezultatul unei pagini din mai multe procese: cel mai bun timp, mediana memoriei, toate calibrările."""
+    result = dict(rounds[0])
+    for key in _TIME_KEYS:
+        values = [r[key] for r in rounds if r[key] is not None]
+        result[key] = min(values) if values else None
+    for key in ("rss_mb", "rss_pagina_mb"):
+        values = [r[key] for r in rounds if r[key] is not None]
+        result[key] = round(statistics.median(values), 1) if values else None
+    result["calibrari_ms"] = [r["calibrare_ms"] for r in rounds]
+    result["calibrare_ms"] = round(statistics.median(result["calibrari_ms"]), 2)
+    result["erori"] = sorted({error for r in rounds for error in r["erori"]})
+    return result
+
+
+def run_calibration(results):
+    """Calibrarea rulării: mediana calibrărilor măsurate în toate procesele paginilor."""
+    return statistics.median(c for result in results.values() for c in result["calibrari_ms"])
+
+
+def relative(results, calibration_ms):
+    """Rezultatele în forma referinței: timpii ca multipli ai calibrării rulării, memoria în MB."""
+    relative_results = {}
+    for page, result in results.items():
+        values = {}
+        for key, baseline_key, is_time in BASELINE_METRICS:
+            value = result.get(key)
+            if is_time and value is not None:
+                value = round(value / calibration_ms, 3)
+            values[baseline_key] = value
+        relative_results[page] = values
+    return relative_results
+
+
+def regressions(results, baseline, tolerance, cold_tolerance=None):
+    """
+    Măsurătorile mai slabe decât referința cu peste `tolerance` (fracție).
+    :param results, baseline: {pagină: {măsurătoare: valoare}}, în forma întoarsă de relative()
+    :param cold_tolerance: Toleranța pentru rularea rece (implicit `tolerance`)
+    """
+    found = []
+    for page, result in results.items():
+        reference = baseline.get(page, {})
+        for _, key, is_time in BASELINE_METRICS:
+            value, expected = result.get(key), reference.get(key)
+            if value is None or not expected:
+                continue
+            allowed = cold_tolerance if key == "rece" and cold_tolerance is not None else tolerance
+            if value > expected * (1 + allowed) + (MIN_SLACK if is_time else 0):
+                unit = "× calibrare" if is_time else "MB"
+                found.append(f"{page}.{key}: {value:.2f} față de {expected:.2f} {unit}")
+    return found
+
+
+def _format(value):
+    return f"{value:.1f}" if value is not None else "-"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("pages", nargs="*", help=f"paginile măsurate (implicit toate: {', '.join(PAGES)})")
+    arg_parser.add_argument("--rounds", type=int, default=3, help="procese separate în care este măsurată fiecare pagină")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="rerulări fără schimbări după rularea rece")
+    arg_parser.add_argument("--options", type=int, default=3, help="valori încercate pentru fiecare selector din bara laterală")
+    arg_parser.add_argument("--no-disk-cache", action="store_true", help="rularea rece citește fișierele Excel, nu cache-ul Parquet")
+    arg_parser.add_argument("--json", help="salvează rezultatele în acest fișier JSON")
+    arg_parser.add_argument("--baseline", default=BASELINE, help="fișier JSON cu rezultate de referință (implicit %(default)s)")
+    arg_parser.add_argument("--save-baseline", action="store_true", help="rescrie referința cu rezultatele acestei rulări")
+    arg_parser.add_argument("--tolerance", type=float, default=0.3, help="încetinirea acceptată față de referință (0.3 = 30%%)")
+    arg_parser.add_argument("--cold-tolerance", type=float, default=0.6, help="încetinirea acceptată pentru rularea rece")
+    arg_parser.add_argument("--worker", metavar="PAGE", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.worker:
+        # Mesajele Streamlit și ale paginilor nu trebuie să se amestece cu rezultatul JSON
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = measure_page(args.worker, args.repeat, args.options, args.no_disk_cache)
+        print(json.dumps(result, ensure_ascii=False))
+        return
+
+    unknown = [page for page in args.pages if page not in PAGES]
+    if unknown:
+        arg_parser.error(f"pagini necunoscute: {', '.join(unknown)}")
+
+    results = {}
+    for page in args.pages or PAGES:
+        print(f"{page}...", end=" ", flush=True)
+        results[page] = combine_rounds([run_worker(page, args) for _ in range(args.rounds)])
+        print(f"{results[page]['rece_ms']:.0f} ms")
+
+    print(f"\n{'pagina':<18} " + " ".join(f"{label:>14}" for _, label in METRICS) + f" {'rerulări':>9}")
+    for page, result in results.items():
+        print(f"{page:<18} " + " ".join(f"{_format(result[key]):>14}" for key, _ in METRICS)
+              + f" {len(result['interactiuni']):>9}")
+    calibration_ms = run_calibration(results)
+    print("Timpi în ms; cald = cea mai bună din", args.repeat, "rerulări; calibrarea rulării", f"{calibration_ms:.1f} ms.")
+
+    failed = {page: result["erori"] for page, result in results.items() if result["erori"]}
+    for page, errors in failed.items():
+        for error in errors:
+            print(f"Eroare în {page}: {error[:300]}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    measured = relative(results, calibration_ms)
+    if args.save_baseline:
+        baseline = {"_unitati": BASELINE_UNITS}
+        if os.path.exists(args.baseline):
+            # Cu o listă de pagini sunt înlocuite doar acestea
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(measured)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False)
+        print("Referința a fost salvată în", args.baseline)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            found = regressions(measured, json.load(f), args.tolerance, args.cold_tolerance)
+        for line in found:
+            print("Regresie:", line)
+        if found:
+            sys.exit(1)
+        print("Fără regresii față de", args.baseline)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Micro-benchmark pentru parsarea paginilor cu indicatori (utils/scraper.py).
+
+Compară varianta inițială a parse_indicator_tables (BeautifulSoup cu html.parser, căutare înapoi
+a titlului pentru fiecare tabel, regex necompilat per celulă) cu extractorul dintr-o singură trecere,
+pe fiecare backend disponibil (BeautifulSoup/html.parser și arborele lxml nativ). Paginile folosite sunt fișierele .html din
+benchmarks/fixtures/, înregistrate de pe statistica.gov.md cu python -m utils.page_fixtures. Fără pagini înregistrate
+scriptul se oprește; --synthetic rulează explicit pe o pagină generată cu aceeași structură, ale cărei cifre
+nu spun cât câștigă paginile reale.
+
+Rulare, din rădăcina proiectului:
+    python -m benchmarks.bench_parse [--repeat 20]
+    python -m benchmarks.bench_parse --synthetic [--sections 40]
+"""
+import argparse
+import glob
+import os
+import re
+import timeit
+
+from bs4 import BeautifulSoup
+
+from utils import scraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def legacy_parse_indicator_tables(soup, default_section=None):
+    """parse_indicator_tables în forma de dinainte de extractorul dintr-o singură trecere (referință)."""
+    indicatori = {}
+    tables = soup.select("table.tablekeyvalue")
+    if not tables:
+        tables = soup.find_all("table")
+
+    for table in tables:
+        title_div = table.find_previous("div", class_="font-18")
+        if title_div:
+            title_tag = title_div.find("b") or title_div
+            sectiune = title_tag.get_text(strip=True)
+        elif default_section:
+            sectiune = default_section
+        else:
+            continue
+
+        indicatori.setdefault(sectiune, {})
+        for row in table.find_all("tr"):
+            cols = row.find_all("td")
+            if len(cols) < 2:
+                continue
+            perioada = cols[0].get_text(strip=True)
+            raw_value = cols[1].get_text(strip=True)
+            raw_value = raw_value.replace("\xa0", "").replace(",", ".").strip()
+            raw_value_clean = re.sub(r"[^0-9\.\-]", "", raw_value)
+            if not raw_value_clean:
+                continue
+            try:
+                valoare = float(raw_value_clean)
+            except ValueError:
+                continue
+            indicatori[sectiune][perioada] = valoare
+
+    return indicatori
+
+
+def synthetic_page(sections=40, rows=12, filler=400):
+    """Pagină cu structura paginilor de indicatori: meniu, titluri <div class="font-18">, tabele tablekeyvalue, subsol."""
+    parts = ["<html><head><title>Indicator</title></head><body><nav><ul>"]
+    parts += [f"<li><a href='/ro/page/{i}'>Pagina {i}</a></li>" for i in range(filler)]
+    parts.append("</ul></nav><main><div class='content'>")
+    parts.append("<p class='date'>Actualizat: 15.03.2025</p>")
+    for s in range(sections):
+        parts.append(f"<div class='font-18'><b>Indicatorul {s}, mil. lei</b></div>")
+        parts.append("<table class='tablekeyvalue'><tbody>")
+        for r in range(rows):
+            parts.append(
+                f"<tr><td>Trimestrul {r % 4 + 1} {2000 + r}</td><td>{s * 1000 + r}\xa0{r:03d},{r % 10}</td></tr>"
+            )
+        parts.append("</tbody></table><p>Sursa: BNS</p>")
+    parts.append("</div></main><footer>")
+    parts += [f"<div class='footer-link'><a href='/f/{i}'>Link {i}</a></div>" for i in range(filler // 4)]
+    parts.append("</footer></body></html>")
+    return "".join(parts)
+
+
+def load_pages():
+    """Paginile înregistrate din FIXTURES_DIR; oprește scriptul dacă nu există niciuna."""
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+    if not pages:
+        raise SystemExit(
+            f"Nu există pagini înregistrate în {FIXTURES_DIR}. Înregistrați-le cu python -m utils.page_fixtures "
+            "sau rulați explicit pe o pagină sintetică cu --synthetic."
+        )
+    return pages
+
+
+def available_backends():
+    backends = ["html.parser"]
+    if scraper.HTML_BACKEND != "html.parser":
+        backends.append(scraper.HTML_BACKEND)
+    return backends
+
+
+def best_ms(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--repeat", type=int, default=20, help="repetări pentru fiecare măsurătoare (se păstrează cea mai bună)")
+    arg_parser.add_argument("--synthetic", action="store_true", help="folosește o pagină sintetică în locul celor înregistrate")
+    arg_parser.add_argument("--sections", type=int, default=40, help="secțiuni în pagina sintetică (cu --synthetic)")
+    args = arg_parser.parse_args()
+
+    if args.synthetic:
+        pages = {f"sintetic ({args.sections} secțiuni)": synthetic_page(args.sections)}
+    else:
+        pages = load_pages()
+
+    for name, html in pages.items():
+        print(f"\n{name} – {len(html) / 1024:.0f} KB")
+
+        soup = BeautifulSoup(html, "html.parser")
+        reference = legacy_parse_indicator_tables(soup)
+        baseline_build = best_ms(lambda: BeautifulSoup(html, "html.parser"), args.repeat)
+        baseline_parse = best_ms(lambda: legacy_parse_indicator_tables(soup), args.repeat)
+        baseline = baseline_build + baseline_parse
+
+        print(f"{'varianta':<24} {'arbore (ms)':>12} {'extragere (ms)':>15} {'total (ms)':>11} {'accelerare':>11}")
+        print(f"{'inițială (html.parser)':<24} {baseline_build:>12.1f} {baseline_parse:>15.1f} {baseline:>11.1f} {1:>10.1f}x")
+
+        for backend in available_backends():
+            doc = scraper.parse_document(html, backend)
+            if scraper.parse_indicator_tables(doc) != reference:
+                raise SystemExit(f"{name}: rezultatele diferă de varianta inițială ({backend})")
+            if scraper.get_data_actualizare(doc) != scraper.get_data_actualizare(soup):
+                raise SystemExit(f"{name}: data actualizării diferă de varianta inițială ({backend})")
+
+            build = best_ms(lambda: scraper.parse_document(html, backend), args.repeat)
+            parse = best_ms(lambda: scraper.parse_indicator_tables(doc), args.repeat)
+            print(f"{'o trecere (' + backend + ')':<24} {build:>12.1f} {parse:>15.1f} {build + parse:>11.1f} "
+                  f"{baseline / (build + parse):>10.1f}x")
+
+        print(f"{sum(len(v) for v in reference.values())} valori în {len(reference)} secțiuni")
+
+
+if __name__ == "__main__":
+    main()
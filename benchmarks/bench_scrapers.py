@@ -0,0 +1,167 @@
+"""
+Benchmark pentru scraper-ele de indicatori (utils/scraper.py), rulat pe paginile înregistrate,
+fără rețea și fără Chrome.
+
+Pentru fiecare indicator sunt măsurate: data "Actualizat" din HTML-ul brut, construirea arborelui,
+get_data_actualizare, parse_indicator_tables, comparația cu starea salvată (fetch_indicator pe o pagină
+neschimbată), scrapingul complet (parsare + salvare), persistența JSON și adăugarea în istoricul SQLite.
+
+Paginile sunt fixture-urile din benchmarks/fixtures/ (python -m utils.page_fixtures le înregistrează);
+fără ele scriptul se oprește, iar --synthetic rulează explicit pe pagini generate (cifrele lor nu sunt
+comparabile cu cele ale paginilor reale). Starea și istoricul sunt scrise într-un director temporar, nu în data/.
+
+Rulare, din rădăcina proiectului:
+    python -m benchmarks.bench_scrapers [--repeat 20] [--json rezultate.json] [--baseline referinta.json]
+    python -m benchmarks.bench_scrapers --synthetic
+
+Cu --baseline, scriptul se termină cu cod 1 dacă o măsurătoare este mai lentă decât referința
+cu mai mult de --tolerance (implicit 30%).
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+from benchmarks.bench_parse import synthetic_page
+from utils import history_store, page_fixtures, scraper
+
+OPERATIONS = [
+    ("data_raw", "data brut"),
+    ("arbore", "arbore"),
+    ("data", "data"),
+    ("tabele", "tabele"),
+    ("fara_schimbari", "neschimbat"),
+    ("complet", "complet"),
+    ("json_scriere", "JSON scr."),
+    ("json_citire", "JSON cit."),
+    ("istoric", "istoric"),
+]
+
+
+def best_ms(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+@contextlib.contextmanager
+def replay_environment(workdir, synthetic=False):
+    """
+    Rulează scraper-ele în modul replay, cu starea și istoricul în workdir.
+    :param synthetic: Folosește pagini sintetice scrise tot în workdir în locul fixture-urilor înregistrate
+    """
+    saved_env = {key: os.environ.get(key) for key in ("SCRAPER_FIXTURES", "SCRAPER_FIXTURES_DIR")}
+    saved_indicators = dict(scraper.INDICATORS)
+    saved_history_db = history_store.HISTORY_DB
+    try:
+        if synthetic:
+            os.environ["SCRAPER_FIXTURES_DIR"] = os.path.join(workdir, "fixtures")
+            for indicator_id in scraper.INDICATORS:
+                page_fixtures.save_fixture(indicator_id, synthetic_page())
+            print("Pagini sintetice (--synthetic); timpii nu sunt cei ai paginilor reale.")
+        elif not page_fixtures.recorded_indicators():
+            raise SystemExit(
+                f"Nu există pagini înregistrate în {page_fixtures.fixtures_dir()}. Înregistrați-le cu "
+                "python -m utils.page_fixtures sau rulați explicit pe pagini sintetice cu --synthetic."
+            )
+        os.environ["SCRAPER_FIXTURES"] = "replay"
+
+        history_store.HISTORY_DB = os.path.join(workdir, "istoric.sqlite")
+        for indicator_id, config in saved_indicators.items():
+            scraper.INDICATORS[indicator_id] = {**config, "state_file": os.path.join(workdir, f"{indicator_id}.json")}
+        yield page_fixtures.recorded_indicators()
+    finally:
+        history_store.HISTORY_DB = saved_history_db
+        scraper.INDICATORS.clear()
+        scraper.INDICATORS.update(saved_indicators)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def measure(indicator_id, workdir, repeat):
+    """Timpii (ms) fiecărei operații din OPERATIONS pentru pagina înregistrată a indicatorului."""
+    config = scraper.INDICATORS[indicator_id]
+    html = page_fixtures.load_fixture(indicator_id)
+    doc = scraper.parse_document(html)
+    data_actualizare = scraper.get_data_actualizare(doc)
+    indicatori = scraper.parse_indicator_tables(doc, default_section=config["default_section"])
+    state = {"data_actualizare": data_actualizare, "indicatori": indicatori}
+    json_path = os.path.join(workdir, f"{indicator_id}.bench.json")
+    db_path = os.path.join(workdir, "istoric.bench.sqlite")
+
+    # Mesajele scraper-elor ar acoperi tabelul cu rezultate
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper.fetch_indicator(indicator_id, force=True)
+        timings = {
+            "data_raw": best_ms(lambda: scraper.get_data_actualizare_raw(html), repeat),
+            "arbore": best_ms(lambda: scraper.parse_document(html), repeat),
+            "data": best_ms(lambda: scraper.get_data_actualizare(doc), repeat),
+            "tabele": best_ms(lambda: scraper.parse_indicator_tables(doc, config["default_section"]), repeat),
+            "fara_schimbari": best_ms(lambda: scraper.fetch_indicator(indicator_id), repeat),
+            "complet": best_ms(lambda: scraper.fetch_indicator(indicator_id, force=True), repeat),
+            "json_scriere": best_ms(lambda: scraper.save_json_state(json_path, state), repeat),
+            "json_citire": best_ms(lambda: scraper.load_json_state(json_path), repeat),
+            "istoric": best_ms(lambda: history_store.record_snapshot(indicator_id, data_actualizare, indicatori, db_path), repeat),
+        }
+    return {
+        "kb": len(html.encode("utf-8")) / 1024,
+        "valori": sum(len(valori) for valori in indicatori.values()),
+        "ms": timings,
+    }
+
+
+def regressions(results, baseline, tolerance):
+    """Măsurătorile mai lente decât referința cu peste `tolerance` (fracție)."""
+    found = []
+    for indicator_id, result in results.items():
+        reference = baseline.get(indicator_id, {}).get("ms", {})
+        for key, ms in result["ms"].items():
+            if key in reference and ms > reference[key] * (1 + tolerance):
+                found.append(f"{indicator_id}.{key}: {ms:.2f} ms față de {reference[key]:.2f} ms")
+    return found
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--repeat", type=int, default=20, help="repetări pentru fiecare măsurătoare (se păstrează cea mai bună)")
+    arg_parser.add_argument("--json", help="salvează rezultatele în acest fișier JSON")
+    arg_parser.add_argument("--baseline", help="fișier JSON cu rezultate de referință (salvat cu --json)")
+    arg_parser.add_argument("--tolerance", type=float, default=0.3, help="încetinirea acceptată față de referință (0.3 = 30%%)")
+    arg_parser.add_argument("--synthetic", action="store_true", help="folosește pagini sintetice în locul celor înregistrate")
+    args = arg_parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir, replay_environment(workdir, args.synthetic) as indicator_ids:
+        for indicator_id in indicator_ids:
+            results[indicator_id] = measure(indicator_id, workdir, args.repeat)
+
+    print(f"{'indicator':<12} {'KB':>5} {'valori':>6} " + " ".join(f"{label:>10}" for _, label in OPERATIONS) + f" {'MB/s':>6}")
+    for indicator_id, result in results.items():
+        ms = result["ms"]
+        # Debitul parsării: arbore + tabele, pe pagina întreagă
+        throughput = result["kb"] / 1024 / ((ms["arbore"] + ms["tabele"]) / 1000)
+        print(f"{indicator_id:<12} {result['kb']:>5.0f} {result['valori']:>6} "
+              + " ".join(f"{ms[key]:>10.2f}" for key, _ in OPERATIONS) + f" {throughput:>6.1f}")
+    print("Timpi în ms (cea mai bună din", args.repeat, "repetări).")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            found = regressions(results, json.load(f), args.tolerance)
+        for line in found:
+            print("Regresie:", line)
+        if found:
+            sys.exit(1)
+        print("Fără regresii față de", args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@ import pandas as pd
 import re
 import plotly.express as px
 import statsmodels.api as sm
-from utils.data_loader import load_data
+from utils.datasets import get_dataset
+from utils import profiling
 # from utils.comert_scraper import fetch_comert_data
 
 import os
@@ -21,6 +22,7 @@ import PyPDF2
 
 # Configurarea paginii
 st.set_page_config(page_title='Macroeconomic', layout='wide')
+profiling.start_page("Indicatori_Macro")
 
 # Titlul aplicației
 # st.title('Indicatorii macroeconomici')
@@ -34,43 +36,28 @@ st.set_page_config(page_title='Macroeconomic', layout='wide')
 col1, col2 = st.columns([1, 4])  # Prima coloană mai mică pentru logo, a doua mai mare pentru text
 
 st.title("Sectorul Extern")
+profiling.step("load")
 # Încărcarea datelor
-df, df_exports, df_influenta, df_influenta_Import, df_exp_lunar, df_exp_imp_total, df_import_ncm_all  = load_data()
-
-month_mapping = {
-    "Ianuarie": 1, "Februarie": 2, "Martie": 3, "Aprilie": 4,
-    "Mai": 5, "Iunie": 6, "Iulie": 7, "August": 8,
-    "Septembrie": 9, "Octombrie": 10, "Noiembrie": 11, "Decembrie": 12
-}
-
-# Dicționar de mapare a lunilor la valori numerice
-month_order = {
-    "Ianuarie": 0,  # Facem "Ianuarie" prima
-    "Ianuarie - Februarie": 11, "Ianuarie - Martie": 10, "Ianuarie - Aprilie": 9,
-    "Ianuarie - Mai": 8, "Ianuarie - Iunie": 7, "Ianuarie - Iulie": 6, "Ianuarie - August": 5,
-    "Ianuarie - Septembrie": 4, "Ianuarie - Octombrie": 3, "Ianuarie - Noiembrie": 2, "Ianuarie - Decembrie": 1
-}
+df, df_exports, df_influenta, df_influenta_Import, df_exp_lunar, df_exp_imp_total, df_import_ncm_all  = get_dataset("comert_exterior")
+# Index precalculat peste Start_Data: filtrele din bara laterală devin căutări, nu filtrări pe tot setul
+trade_index = get_dataset("trade_index")
 
 
 # Verificăm dacă există date    
 if df.empty:
     st.warning("Nu există date disponibile. Verificați fișierul sursă.")
-    st.stop()
-
-# Convertim toate coloanele relevante în string pentru a evita erorile de concatenare
-df = df.astype({"An": "int", "Trimestru": "Int64", "Semestru": "Int64"})
-df = df.astype({"An": "str", "Lună": "str", "Trimestru": "str", "Semestru": "str"})
+    profiling.stop()
 
 # Sidebar pentru selecții
 
 st.sidebar.header("Filtre")
 # Adăugare FILTRU pentru selecția anului
-selected_year = st.sidebar.selectbox("Selectează anul:",sorted(df["An"].unique(), reverse=True))
+selected_year = st.sidebar.selectbox("Selectează anul:",trade_index.years)
 selected_period = st.sidebar.selectbox("Selectează perioada:", ["Lunară"])
 selected_indicator = st.sidebar.selectbox("Selectează indicatorul:", ["Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"])
-selected_country = st.sidebar.selectbox("Selectează țara:", ["Toate"] + list(df["Țară"].unique()))
+selected_country = st.sidebar.selectbox("Selectează țara:", ["Toate"] + trade_index.countries)
 selected_group = st.sidebar.selectbox("Selectează grupul de țări:", ["Toate", "UE", "CSI", "Restul lumii"])
-selected_month = st.sidebar.selectbox("Selectează intervalul:", df["Lună"].unique())
+selected_month = st.sidebar.selectbox("Selectează intervalul:", trade_index.periods)
 
 # assistant_active = st.sidebar.checkbox("Activare Asistent MDED")
 
@@ -128,35 +115,17 @@ st.sidebar.markdown(
     unsafe_allow_html=True
 )
 
-# Filtrare după țară dacă este selectată una
-if selected_year != "Toți":
-    df = df[df["An"] == selected_year]
-
-if selected_country != "Toate":
-    df = df[df["Țară"] == selected_country]
-
-# Filtrare după grup de țări
-if selected_group != "Toate":
-    df = df[df["Grupă Țări"] == selected_group]
-
-# Grupare în funcție de perioada selectată
-if selected_period == "Trimestrial":
-    df["Perioadă"] = df["An"] + "-Q" + df["Trimestru"]
-elif selected_period == "Semestrial":
-    df["Perioadă"] = df["An"] + "-S" + df["Semestru"]
-elif selected_period == "Anual":
-    df["Perioadă"] = df["An"]
-else:
-    df["Perioadă"] = df["Lună"]
+profiling.step("transform", "filtre și totaluri")
+# Filtrare după an, țară și grup de țări ("Toate" înseamnă fără filtru).
+# Toate agregările de mai jos sunt citite din cubul precalculat, nu recalculate la fiecare rerulare.
+index_filters = {
+    "year": selected_year,
+    "country": None if selected_country == "Toate" else selected_country,
+    "group": None if selected_group == "Toate" else selected_group,
+}
 
-# Asigurăm că indicatorii sunt numerici înainte de agregare
-for col in ["Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"]:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
- 
-df_grouped = df.groupby(["Perioadă", "Țară"])[selected_indicator].sum().reset_index()
-# Filtrare pentru luna selectată
-df_month = df[df["Lună"] == selected_month]
+# Totalurile pentru luna selectată
+df_month_totals = trade_index.totals([], period=selected_month, **index_filters)
 
 
 selected_row = df_exp_imp_total.iloc[-1]
@@ -167,6 +136,7 @@ deficit_val = selected_row["Sold Comercial (mil. $)"]
 deficit_val_Imp = selected_row_Imp["Importuri (mil. $)"]
 deficit_val_Exp = selected_row_Exp["Exporturi (mil. $)"]
 
+profiling.step("figure", "diagrame sinteză")
 # Cele 4 diagrame Start
 
 # Date PIB
@@ -244,10 +214,11 @@ st.markdown("<hr>", unsafe_allow_html=True)
 st.title("Analiza comerțului internațional")
 # Subtittlu mijloc ecran
 
+profiling.step("figure", "top 10 țări")
 # Crearea layout-ului cu două coloane
 col1, col2 = st.columns(2)
 
-df_top_import = df_month.sort_values(by="Importuri (mil. $)", ascending=False).head(10)
+df_top_import = trade_index.top("Importuri (mil. $)", 10, period=selected_month, **index_filters)
 
 if df_top_import.empty:
      st.warning(f"Nu există date disponibile pentru  **{selected_month} {selected_year}**  privind importurile.")
@@ -255,8 +226,7 @@ else:
 # Top 10 țări pentru importuri în coloana stângă
     with col1:
         st.subheader(f"Top 10 Țări - Importuri, {selected_month} {selected_year} ")
-        df_top_import = df_month.sort_values(by="Importuri (mil. $)", ascending=False).head(10)
-        other_import_value = df_month["Importuri (mil. $)"].sum() - df_top_import["Importuri (mil. $)"].sum()
+        other_import_value = df_month_totals["Importuri (mil. $)"].sum() - df_top_import["Importuri (mil. $)"].sum()
         df_top_import = pd.concat([df_top_import, pd.DataFrame([{"Țară": "Altele", "Importuri (mil. $)": other_import_value}])], ignore_index=True)
         total_import = df_top_import["Importuri (mil. $)"].sum()
         df_top_import["Procent"] = (df_top_import["Importuri (mil. $)"] / total_import) * 100
@@ -264,22 +234,23 @@ else:
         st.plotly_chart(fig_pie_import, use_container_width=True)
 
 
-df_top_export = df_month.sort_values(by="Exporturi (mil. $)", ascending=False).head(10)
+df_top_export = trade_index.top("Exporturi (mil. $)", 10, period=selected_month, **index_filters)
 if df_top_import.empty:
      st.warning(f"Nu există date disponibile pentru anul **{selected_month} {selected_year}** privind exporturile.")
 else:
 # Top 10 țări pentru exporturi în coloana dreaptă
     with col2:
         st.subheader(f"Top 10 Țări - Exporturi, {selected_month} {selected_year} ")
-        df_top_export = df_month.sort_values(by="Exporturi (mil. $)", ascending=False).head(10)
-        other_export_value = df_month["Exporturi (mil. $)"].sum() - df_top_export["Exporturi (mil. $)"].sum()
+        other_export_value = df_month_totals["Exporturi (mil. $)"].sum() - df_top_export["Exporturi (mil. $)"].sum()
         df_top_export = pd.concat([df_top_export, pd.DataFrame([{"Țară": "Altele", "Exporturi (mil. $)": other_export_value}])], ignore_index=True)
         total_export = df_top_export["Exporturi (mil. $)"].sum()
         df_top_export["Procent"] = (df_top_export["Exporturi (mil. $)"] / total_export) * 100
         fig_pie_export = px.pie(df_top_export, names="Țară", values="Procent", title="Ponderea Top 10 Țări - Exporturi", hole=0.4)
         st.plotly_chart(fig_pie_export, use_container_width=True)
 
-df_total = df.groupby("Perioadă")[["Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"]].sum().reset_index()
+profiling.step("transform", "variații pe perioadă")
+# Totalurile pe perioada selectată (lunar, trimestrial, semestrial sau anual)
+df_total = trade_index.period_totals(selected_year, selected_period, index_filters["country"], index_filters["group"])
 
 # Selectăm doar ultima perioadă din setul de date pentru calculul valorilor
 latest_data = df_total.iloc[-1]
@@ -334,26 +305,16 @@ def generate_description(selected_month, latest_data, previous_data):
 # st.markdown(generate_description(selected_month, latest_data, previous_data))
 # Text finish
 
-# Step 2: Strip any extra whitespace from the strings
-df_exports["Lună"] = df_exports["Lună"].str.strip()
-
-# Step 3: Map the month names to numbers
-df_exports["Lună"] = df_exports["Lună"].map(month_mapping)
-
-# Step 4: Convert the column to integers
-df_exports["Lună"] = df_exports["Lună"].astype(int)
-
-# Convertim coloanele relevante
-df_exports["An"] = df_exports["An"].astype(str)
-
-df_exports["Lună"] = df_exports["Lună"].astype(str)
+profiling.step("figure", "exporturi autohtone și reexporturi")
+# "Lună" vine din loader ca categorie ordonată a lunilor (fără spații); numărul lunii (1–12)
+# pentru axa graficului este codul categoriei + 1
+df_exports["Lună"] = df_exports["Lună"].cat.codes + 1
 
 # Convertim valorile la format numeric
 for col in ["Exporturi autohtone", "Reexporturi"]:
     df_exports[col] = pd.to_numeric(df_exports[col], errors='coerce').fillna(0)
 
 # Sortăm după An și Lună pentru a păstra ordinea corectă
-df_exports["Lună"] = df_exports["Lună"].astype(int)
 df_exports = df_exports.sort_values(by=["An", "Lună"])
 
 
@@ -391,7 +352,7 @@ df_exp_lunar["An"] = df_exp_lunar["An"].astype(str).str.replace(",", "").astype(
 selected_year = int(selected_year)
 
 # Aplică filtrarea
-df_exports_filtered_Export = df_exp_lunar[df_exp_lunar["An"] == selected_year].copy()
+df_exports_filtered_Export = df_exp_lunar[df_exp_lunar["An"] == selected_year]
 
 # Verificăm câte luni sunt prezente în setul de date filtrat
 num_months = df_exports_filtered_Export["Lună"].nunique()
@@ -402,9 +363,8 @@ elif num_months == 1:
     single_month = df_exports_filtered_Export["Lună"].iloc[0]
     # st.warning(f"Există date doar pentru luna {single_month} în anul {selected_year}.")
 
-# Sortăm lunile corect
-df_exports_filtered_Export["Sort_Index"] = df_exports_filtered_Export["Lună"].map(month_order)
-df_exports_filtered_Export = df_exports_filtered_Export.sort_values(by="Sort_Index").drop(columns=["Sort_Index"])
+# Sortăm lunile corect (categoria ordonată "Lună" se sortează după codurile ei)
+df_exports_filtered_Export = df_exports_filtered_Export.sort_values(by="Lună")
 
 # Creăm și afișăm graficul doar dacă există mai mult de o lună de date
 if not df_exports_filtered_Export.empty:
@@ -425,14 +385,12 @@ if not df_exports_filtered_Export.empty:
 
 
 
+profiling.step("figure", "grupe de țări")
 # Creăm un layout cu două coloane
 col1, col2 = st.columns([4, 1])  # Jumătate-jumătate pentru text și grafic
 
-# Filtrare date în funcție de luna selectată
-df_filtered = df[df["Lună"] == selected_month]
-
-# Grupăm datele după grupul de țări
-df_countries_grouped = df_filtered.groupby("Grupă Țări")[["Exporturi (mil. $)", "Importuri (mil. $)"]].sum().reset_index()
+# Totalurile pe grup de țări pentru luna selectată
+df_countries_grouped = trade_index.totals(["Grupă Țări"], period=selected_month, **index_filters)[["Grupă Țări", "Exporturi (mil. $)", "Importuri (mil. $)"]]
 
 # Calculăm totalul schimburilor comerciale pentru fiecare grupă
 df_countries_grouped["Total Comerț"] = df_countries_grouped["Exporturi (mil. $)"] + df_countries_grouped["Importuri (mil. $)"] 
@@ -445,8 +403,8 @@ fig_donut = px.pie(df_countries_grouped, names="Grupă Țări", values="Procent"
                    hole=0.4,  
                    labels={"Grupă Țări": "Grupa de Țări"},
                    color_discrete_sequence=["#4C8BF5", "#A9C9E8", "#6C757D"])
-total_exports = df_filtered["Exporturi (mil. $)"].sum() / 1000
-total_imports = df_filtered["Importuri (mil. $)"].sum() / 1000
+total_exports = df_month_totals["Exporturi (mil. $)"].sum() / 1000
+total_imports = df_month_totals["Importuri (mil. $)"].sum() / 1000
 trade_deficit = total_exports - total_imports  # Deficitul comercial
 
 # Adăugăm etichete personalizate cu procentaj + valoarea în milioane $
@@ -507,31 +465,22 @@ else:
     with col2:
         st.plotly_chart(fig_donut, use_container_width=True)
 
-# Definirea ordinii corecte pentru sortare
-month_order = {
-    "Ianuarie": 0,  # Facem "Ianuarie" prima
-    "Ianuarie - Februarie": 1, "Ianuarie - Martie": 2, "Ianuarie - Aprilie": 3,
-    "Ianuarie - Mai": 4, "Ianuarie - Iunie": 5, "Ianuarie - Iulie": 6, "Ianuarie - August": 7,
-    "Ianuarie - Septembrie": 8, "Ianuarie - Octombrie": 9, "Ianuarie - Noiembrie": 10, "Ianuarie - Decembrie": 11
-}
-
-# Aplicăm mapping-ul pentru a avea valori numerice asociate perioadelor
-df_total["Sort_Index"] = df_total["Perioadă"].map(month_order)
-
-# Asigurăm că valorile nespecificate primesc un index mare pentru a fi plasate la final
-df_total["Sort_Index"] = df_total["Sort_Index"].fillna(99)
-
-# Sortare după index-ul definit (crescător, cu "Ianuarie" prima)
-df_total = df_total.sort_values(by="Sort_Index", ascending=True).drop(columns=["Sort_Index"])
+# df_total vine din cub deja ordonat cronologic ("Perioadă" este categoria ordonată a perioadelor cumulative)
 
+profiling.step("figure", "evoluția indicatorului")
 # Afișare grafic principal - Total agregat fără divizări
 st.subheader(f"Evoluția {selected_indicator} (Perioadă - {selected_period})")
 fig = px.bar(df_total, x="Perioadă", y=selected_indicator, title=f"{selected_indicator} în timp", 
              labels={selected_indicator: "Valoare (mil. $)"}, barmode='relative')
 st.plotly_chart(fig, use_container_width=True)
 
-# Filtrare pentru perioada selectată
-df_grouped_filtered = df_grouped[df_grouped["Perioadă"] == selected_month ]
+profiling.step("render", "tabel pe țări")
+# Filtrare pentru perioada selectată; tabelul pe țări există doar pentru perioadele lunare
+if selected_period == "Lunară":
+    df_grouped_filtered = trade_index.totals(["Lună", "Țară"], period=selected_month, **index_filters)
+    df_grouped_filtered = df_grouped_filtered.rename(columns={"Lună": "Perioadă"})[["Perioadă", "Țară", selected_indicator]]
+else:
+    df_grouped_filtered = pd.DataFrame(columns=["Perioadă", "Țară", selected_indicator])
 
 # Afișare tabel filtrat pe toată lățimea ecranului
 st.subheader(f"Tabel **{selected_indicator} {selected_year}** - {selected_month}")  
@@ -539,6 +488,7 @@ if df_grouped_filtered.empty:
     st.warning(f"Nu există date pentru perioada selectată **{selected_month} {selected_year}.**")
 st.dataframe(df_grouped_filtered, use_container_width=True)
 
+profiling.step("figure", "influența asupra exporturilor")
 # Eliminăm spațiile extra din coloana "Lună"
 df_influenta["Lună"] = df_influenta["Lună"].str.strip()
 
@@ -551,7 +501,7 @@ df_influenta_filtered = df_influenta[
 # Dacă nu există date, afișăm o eroare clară
 if df_influenta_filtered.empty:
     st.error(f" Nu sunt date pentru perioada selectată **{selected_month} {selected_year}.**")
-    st.stop()
+    profiling.stop()
 
 # Convertim "Grad" în numeric și eliminăm NaN
 df_influenta_filtered["Grad"] = pd.to_numeric(df_influenta_filtered["Grad"], errors="coerce")
@@ -575,6 +525,7 @@ fig_influenta = px.bar(
 
 # Afișare grafic
 st.plotly_chart(fig_influenta, use_container_width=True)
+profiling.step("figure", "influența asupra importurilor")
 # Eliminăm spațiile extra din coloana "Lună"
 df_influenta_Import["Lună"] = df_influenta_Import["Lună"].str.strip()
 
@@ -586,7 +537,7 @@ df_influenta_filtered_import = df_influenta_Import[
 # Dacă nu există date, afișăm un mesaj de eroare
 if df_influenta_filtered_import.empty:
     st.error(f" Nu sunt date pentru perioada selectată **{selected_month} {selected_year}.**")
-    st.stop()
+    profiling.stop()
 
 # Convertim "Grad" în numeric și eliminăm NaN
 df_influenta_filtered_import["Grad"] = pd.to_numeric(df_influenta_filtered_import["Grad"], errors="coerce")
@@ -613,6 +564,7 @@ st.plotly_chart(fig_influenta_import, use_container_width=True)
 
 
 
+profiling.step("figure", "importuri pe grupe de mărfuri")
 # Mapping între perioadă și foaia Excel
 sheet_mapping = {
     "Ianuarie": "Import_NCM_I",
@@ -628,13 +580,12 @@ sheet_mapping = {
 
 selected_sheet_name  = sheet_mapping.get(selected_month)
 
-df_import_ncm_all = load_data()[6]  # sau alt index dacă ai modificat ordinea returnării
-
-if isinstance(df_import_ncm_all, dict) and selected_sheet_name in df_import_ncm_all:
+# df_import_ncm_all citește doar foaia perioadei selectate
+if selected_sheet_name in df_import_ncm_all:
     df_import_ncm_luna = df_import_ncm_all[selected_sheet_name]
 else:
     st.error(f"Nu s-au găsit date pentru perioada {selected_month}")
-    st.stop()
+    profiling.stop()
 
 # --- Extrage doar rândurile cu cifre romane împreună cu filtrul de lună ---
 def is_roman(value):
@@ -909,4 +860,6 @@ st.dataframe(df_pondere_display.reset_index(drop=True), use_container_width=True
 st.markdown("""
     <hr style='border: 1px solid #ddd;'>
     <p style='text-align: center; color: grey;'>© 2025 APM. Toate drepturile rezervate.</p>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+profiling.finish_page()
@@ -5,7 +5,11 @@ import pandas as pd
 import plotly.express as px
 import os
 
+from utils.datasets import get_dataset
+from utils import profiling
+
 st.set_page_config(page_title="Sector monetar", layout="wide")
+profiling.start_page("Monetar")
 
 # ========== STIL GENERAL ==========
 st.markdown("""
@@ -33,13 +37,13 @@ st.title("Sectorul monetar")
 file_path = os.path.join("data", "Test_Data_Sector_Monetar.xlsx")
 
 try:
-    df_mon = pd.read_excel(file_path, sheet_name="Monetar")
+    df_mon = get_dataset("monetar")
 except FileNotFoundError:
     st.error(
         f"Fișierul nu a fost găsit: `{file_path}`.\n"
         f"Verifică să fie în folderul `data/` sau actualizează calea / numele fișierului."
     )
-    st.stop()
+    profiling.stop()
 
 # Denumiri coloane (conform structurii date)
 COL_YEAR = "An"
@@ -72,7 +76,7 @@ selected_year = st.sidebar.selectbox(
 row_sel = df_mon[df_mon[COL_YEAR] == selected_year]
 if row_sel.empty:
     st.error("Nu există date pentru anul selectat.")
-    st.stop()
+    profiling.stop()
 
 row_sel = row_sel.iloc[0]
 
@@ -223,3 +227,4 @@ with col_right:
     )
     st.plotly_chart(fig_cpi, use_container_width=True)
 
+profiling.finish_page()
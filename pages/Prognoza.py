@@ -8,38 +8,18 @@ import plotly.express as px
 
 from statsmodels.tsa.api import VAR
 from statsmodels.tsa.arima.model import ARIMA
+
+from utils.datasets import get_dataset
+from utils import profiling
 # ======================
 # === DATE MODEL CLASIC
 # ======================
 
-def load_forecast_data():
-    path = "data/Model.xlsx"
-    df_raw = pd.read_excel(path, sheet_name="EX_IM_gap model", header=None)
-
-    indicatori = [
-        "Real exports, mn USD",
-        "Real Imports, mn USD",
-        "Foreign demand, index",
-        "REER, index (increase =appreciation)",
-        "Exchange rate",
-        "Real investment, mn MDL"
-    ]
-
-    data = {}
-    for indicator in indicatori:
-        idx = df_raw[df_raw[0] == indicator].index[0]
-        values = df_raw.loc[idx, 2:26].values
-        data[indicator] = pd.to_numeric(values, errors="coerce")
-
-    df = pd.DataFrame(data)
-    df.index = list(range(2000, 2000 + len(df)))
-    df.index.name = "An"
-    return df
-
 st.set_page_config(page_title="Prognoza Comerț", layout="wide")
+profiling.start_page("Prognoza")
 st.title("Prognoza Exporturi și Importuri 2025–2028")
 
-df_model = load_forecast_data()
+df_model = get_dataset("model_gap")
 
 # === MODEL GAP OLS
 X_exp = sm.add_constant(df_model[["Foreign demand, index", "REER, index (increase =appreciation)",
@@ -90,26 +70,7 @@ st.plotly_chart(fig, use_container_width=True)
 # ========================
 st.subheader("Prognoza detaliată pe baza BoP")
 
-@st.cache_data
-def load_bop_data():
-    df = pd.read_excel("data/BoP-data.xlsx", sheet_name="Selected_data", header=None)
-    df.columns = df.iloc[0]
-    df = df[1:]
-    df = df.rename(columns={df.columns[0]: "Quarter", "Import of goods ": "Import of goods"})
-    df["Year"] = df["Quarter"].str.extract(r'(\d{4})').astype(int)
-    
-
-    df["Quarter_Label"] = df["Quarter"]  # păstrăm denumirea trimestrelor ex: 2015_Q1
-
-    cols = ["Quarter_Label", "Year", "Export of goods", "Import of goods", "Export of services", "Import of services",
-            "Euro-Average of Q", "Gross External Debt", "General government Ext. Debt"]
-    df = df[cols].copy()
-    df = df[df["Year"] >= 2020]
-    for c in cols[2:]:  # începem de la prima coloană numerică
-        df[c] = pd.to_numeric(df[c], errors="coerce")
-    return df.dropna()
-
-df_bop = load_bop_data()
+df_bop = get_dataset("bop")
 
 # === Funcție pentru modelare și prognoză pe 4 trimestre ===
 def forecast_indicator(df, target):
@@ -311,3 +272,5 @@ st.markdown("""
 exporturi/importuri de bunuri/servicii) folosind 3 variabile explicative: cursul de schimb (EUR),
 datoria externă  și datoria gov.
 """)
+
+profiling.finish_page()
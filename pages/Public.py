@@ -6,7 +6,11 @@ import plotly.express as px
 import pandas as pd
 import os
 
+from utils.datasets import get_dataset
+from utils import profiling
+
 st.set_page_config(page_title="Finanțe publice – Structura bugetului", layout="wide")
+profiling.start_page("Public")
 
 # ====== Stil general mai modern și font clar ======
 st.markdown("""
@@ -44,15 +48,13 @@ Analiza **veniturilor și cheltuielilor bugetului public național**.
 file_path = os.path.join("data", "Test_Data_Venituri_Cheltuieli.xlsx")
 
 try:
-    xls = pd.ExcelFile(file_path)
+    df_venituri = get_dataset("venituri")
+    df_chelt_f = get_dataset("cheltuieli_f")
+    df_debt = get_dataset("datoria")   # <<< NOU
 except FileNotFoundError:
     st.error(f"Fișierul nu a fost găsit: `{file_path}`.\n"
              f"Verifică să fie în folderul `data/` sau actualizează calea în cod.")
-    st.stop()
-
-df_venituri = pd.read_excel(xls, sheet_name="Venituri")
-df_chelt_f = pd.read_excel(xls, sheet_name="Cheltuieli_F")
-df_debt = pd.read_excel(xls, sheet_name="Datoria")   # <<< NOU
+    profiling.stop()
 
 df_venituri["Date"] = pd.to_datetime(df_venituri["Date"])
 df_chelt_f["Date"] = pd.to_datetime(df_chelt_f["Date"])
@@ -65,7 +67,7 @@ df_debt.columns = df_debt.columns.str.strip()        # eliminăm eventualele spa
 common_dates = sorted(set(df_venituri["Date"]).intersection(df_chelt_f["Date"]))
 if not common_dates:
     st.error("Nu există nicio perioadă comună între foile 'Venituri' și 'Cheltuieli_F'.")
-    st.stop()
+    profiling.stop()
 
 month_names_ro = {
     1: "ianuarie", 2: "februarie", 3: "martie", 4: "aprilie",
@@ -96,7 +98,7 @@ selected_month = month_label_to_num[selected_month_label]
 matching = [d for d in common_dates if d.year == selected_year and d.month == selected_month]
 if not matching:
     st.error("Nu există date pentru combinația selectată de lună și an.")
-    st.stop()
+    profiling.stop()
 
 selected_date = matching[0]
 st.caption(
@@ -605,4 +607,6 @@ fig_debt.update_layout(
     margin=dict(l=40, r=20, t=40, b=80),
 )
 
-st.plotly_chart(fig_debt, use_container_width=True)
\ No newline at end of file
+st.plotly_chart(fig_debt, use_container_width=True)
+
+profiling.finish_page()
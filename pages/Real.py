@@ -5,7 +5,11 @@ import pandas as pd
 import plotly.express as px
 import os
 
+from utils.datasets import get_dataset
+from utils import profiling
+
 st.set_page_config(page_title="Sector real", layout="wide")
+profiling.start_page("Real")
 
 # ========== STIL GENERAL ==========
 st.markdown("""
@@ -26,19 +30,20 @@ st.markdown("""
 
 st.title("Sectorul real")
 
+profiling.step("load")
 # =====================================================
 # 1. ÎNCĂRCAREA DATELOR – SECTOR REAL (ANUAL)
 # =====================================================
 file_path = os.path.join("data", "Real.xlsx")
 
 try:
-    df_real = pd.read_excel(file_path, sheet_name="Real")
+    df_real = get_dataset("real")
 except FileNotFoundError:
     st.error(
         f"Fișierul nu a fost găsit: `{file_path}`.\n"
         f"Verifică să fie în folderul `data/` sau actualizează calea / numele fișierului."
     )
-    st.stop()
+    profiling.stop()
 
 COL_YEAR  = "An"
 COL_IND   = "Producția industrială, mil. lei"
@@ -57,7 +62,7 @@ df_real = df_real.dropna(subset=[COL_YEAR]).sort_values(COL_YEAR)
 # =====================================================
 df_trans = None
 try:
-    df_trans = pd.read_excel(file_path, sheet_name="Tranport")
+    df_trans = get_dataset("real_transport")
     df_trans["An"] = pd.to_numeric(df_trans["An"], errors="coerce").astype("Int64")
     df_trans["Trimestrul"] = df_trans["Trimestrul"].astype(str)
     df_trans["Perioadă"] = df_trans["An"].astype(str) + " " + df_trans["Trimestrul"].str.replace("Trimestrul ", "T")
@@ -70,7 +75,7 @@ except Exception:
 # =====================================================
 df_agr_q = None
 try:
-    df_agr_q = pd.read_excel(file_path, sheet_name="Agricultura")
+    df_agr_q = get_dataset("real_agricultura")
 
     # conversii de tip
     df_agr_q["An"] = pd.to_numeric(df_agr_q["An"], errors="coerce").astype("Int64")
@@ -103,7 +108,7 @@ except Exception:
 # =====================================================
 df_pib = None
 try:
-    df_pib = pd.read_excel(file_path, sheet_name="PIB")
+    df_pib = get_dataset("real_pib")
     df_pib["An"] = pd.to_numeric(df_pib["An"].astype(str).str.replace(",", ""), errors="coerce").astype("Int64")
 
     # Creștere reală PIB (%): PIB comparabil_t / PIB curent_{t-1} - 1
@@ -118,7 +123,7 @@ except Exception:
 # =====================================================
 df_pib_use = None
 try:
-    df_pib_use = pd.read_excel(file_path, sheet_name="PIB_utilizari")
+    df_pib_use = get_dataset("real_pib_utilizari")
     df_pib_use["An"] = pd.to_numeric(df_pib_use["An"].astype(str).str.replace(",", ""), errors="coerce").astype("Int64")
 except Exception:
     df_pib_use = None
@@ -128,7 +133,7 @@ except Exception:
 # =====================================================
 df_ind = None
 try:
-    df_ind = pd.read_excel(file_path, sheet_name="Industrie")
+    df_ind = get_dataset("real_industrie")
     df_ind["An"] = pd.to_numeric(df_ind["An"], errors="coerce").astype("Int64")
     for col in df_ind.columns:
         if col != "An":
@@ -142,7 +147,7 @@ except Exception:
 # =====================================================
 df_ind_prel = None
 try:
-    df_ind_prel = pd.read_excel(file_path, sheet_name="Industrie_Prel")
+    df_ind_prel = get_dataset("real_industrie_prel")
     df_ind_prel["An"] = pd.to_numeric(df_ind_prel["An"], errors="coerce").astype("Int64")
 
     # conversie numerică pentru toate coloanele, în afară de "An"
@@ -165,6 +170,7 @@ try:
 except Exception:
     df_ind_prel = None
 
+profiling.step("transform", "filtru an")
 # =====================================================
 # FILTRU AN
 # =====================================================
@@ -177,6 +183,7 @@ selected_year = st.sidebar.selectbox(
 )
 st.caption(f"An selectat: **{selected_year}**")
 
+profiling.step("render", "privire de ansamblu")
 # =====================================================
 # PRIVIRE DE ANSAMBLU – TEXT + KPI
 # =====================================================
@@ -322,6 +329,7 @@ tab_pib, tab_ind_tab, tab_agr, tab_trade, tab_trans_tab, tab_inv = st.tabs([
     "Investiții directe",
 ])
 
+profiling.step("figure", "PIB")
 # =====================================================
 # TAB: PIB
 # =====================================================
@@ -733,6 +741,7 @@ with tab_pib:
     else:
         st.warning("Nu s-au putut încărca datele de PIB.")
 
+profiling.step("figure", "producția industrială")
 # =====================================================
 # TAB: PRODUCȚIA INDUSTRIALĂ
 # =====================================================
@@ -842,6 +851,7 @@ with tab_ind_tab:
     else:
         st.info("Nu s-au putut încărca datele din foaia 'Industrie_Prel'.")
 
+profiling.step("figure", "producția agricolă")
 # =====================================================
 # TAB: PRODUCȚIA AGRICOLĂ
 # =====================================================
@@ -914,6 +924,7 @@ with tab_agr:
     else:
         st.info("Nu s-au putut încărca indicii trimestriali ai producției agricole (foaia 'Agricultura').")
 
+profiling.step("figure", "comerț intern")
 # =====================================================
 # TAB: COMERȚ INTERN
 # =====================================================
@@ -925,6 +936,7 @@ with tab_trade:
     else:
         st.info("Nu sunt date.")
 
+profiling.step("figure", "transport")
 # =====================================================
 # TAB: TRANSPORT
 # =====================================================
@@ -1068,6 +1080,7 @@ with tab_trans_tab:
     else:
         st.info("Nu s-au putut încărca datele pentru transport.")
 
+profiling.step("figure", "investiții directe")
 # =====================================================
 # TAB: INVESTIȚII DIRECTE
 # =====================================================
@@ -1075,3 +1088,5 @@ with tab_inv:
     st.markdown("#### Investiții directe acumulate (mil. USD)")
     fig_fdi = px.line(df_real, x=COL_YEAR, y=COL_FDI, markers=True, template="simple_white")
     st.plotly_chart(fig_fdi, use_container_width=True)
+
+profiling.finish_page()
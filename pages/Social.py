@@ -5,7 +5,11 @@ import pandas as pd
 import plotly.express as px
 import os
 
+from utils.datasets import get_dataset
+from utils import profiling
+
 st.set_page_config(page_title="Sector social", layout="wide")
+profiling.start_page("Social")
 
 # ========== STIL GENERAL ==========
 st.markdown("""
@@ -38,13 +42,13 @@ populația ocupată, numărul șomerilor, rata șomajului, rata de ocupare și c
 file_path = os.path.join("data", "Test_Data_Sector_Social.xlsx")
 
 try:
-    df_social = pd.read_excel(file_path, sheet_name="Social")
+    df_social = get_dataset("social")
 except FileNotFoundError:
     st.error(
         f"Fișierul nu a fost găsit: `{file_path}`.\n"
         f"Verifică să fie în folderul `data/` sau actualizează calea / numele fișierului."
     )
-    st.stop()
+    profiling.stop()
 
 # Denumirile coloanelor (conform structurii noi)
 COL_YEAR  = "An"
@@ -93,7 +97,7 @@ matching = df_social[
 
 if matching.empty:
     st.error("Nu există date pentru combinația selectată de an și trimestru.")
-    st.stop()
+    profiling.stop()
 
 row_sel = matching.iloc[0]
 
@@ -287,3 +291,5 @@ fig_wage.update_layout(
     margin=dict(l=40, r=20, t=40, b=80),
 )
 st.plotly_chart(fig_wage, use_container_width=True)
+
+profiling.finish_page()
@@ -0,0 +1,21 @@
+from utils.periods import month_key, parse_period, value_period
+
+
+def test_value_period_uses_row_label_period():
+    assert value_period("Trim. II 2025", "Anul 2024") == parse_period("Anul 2024")
+
+
+def test_value_period_falls_back_to_section_without_period():
+    assert value_period("Trim. II 2025", "Rata de ocupare, %") == parse_period("Trim. II 2025")
+
+
+def test_value_period_base_year_row_takes_section_year():
+    # "2010=100" are doar baza; perioada valorii vine din titlul secțiunii
+    period = value_period("Trim. II 2025", "2010=100")
+    assert (period.start, period.end) == (month_key(2025, 4), month_key(2025, 6))
+    assert (period.base_start, period.base_end) == (month_key(2010, 1), month_key(2010, 12))
+    assert period.comparison == "baza_fixa"
+
+
+def test_value_period_base_year_row_without_section_period():
+    assert value_period("Indicele producției, %", "2010=100") == parse_period("2010=100")
@@ -1,5 +1,171 @@
 import pandas as pd
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from utils.excel_cache import list_sheets, read_sheet, read_sheets
+
+# Vocabularele canonice ale coloanei "Lună", aplicate la încărcare ca categorii ordonate, astfel încât
+# sortarea după lună este o sortare după codurile întregi ale categoriei:
+#   MONTHS             – lunile calendaristice (Exp_Reexp, Exp_Lunar)
+#   CUMULATIVE_PERIODS – perioadele cumulative (Start_Data, Exp_imp_Total): "Ianuarie", "Ianuarie - Februarie", ...
+MONTHS = ["Ianuarie", "Februarie", "Martie", "Aprilie", "Mai", "Iunie",
+          "Iulie", "August", "Septembrie", "Octombrie", "Noiembrie", "Decembrie"]
+CUMULATIVE_PERIODS = [MONTHS[0]] + [f"{MONTHS[0]} - {month}" for month in MONTHS[1:]]
+
+# Schema declarativă a foilor din Data.xlsx, aplicată de apply_schema:
+#   usecols    – coloanele păstrate, selectate direct la citirea foii
+#   ffill      – coloane completate în jos (celulele unite din Excel, ex. "An")
+#   dtypes     – tipurile aplicate după completare
+#   dropna     – coloanele cheie; rândurile fără valori în ele sunt eliminate
+#   strip      – coloane text din care eliminăm spațiile de la capete
+#   categories – coloane convertite în categorii: listă = ordine impusă (categorie ordonată),
+#                None = categorii neordonate deduse din date
+SHEET_SCHEMAS = {
+    "Start_Data": {
+        "usecols": ["An", "Lună", "Țară", "Grupă Țări", "Trimestru", "Semestru",
+                    "Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"],
+        "ffill": ["An"],
+        "dtypes": {"An": "Int64"},
+        "dropna": ["Lună", "Țară"],
+        "categories": {
+            "Lună": CUMULATIVE_PERIODS,
+            "Țară": None,
+            "Grupă Țări": None,
+            "Trimestru": [1, 2, 3, 4],
+            "Semestru": [1, 2],
+        },
+    },
+    "Exp_Reexp": {
+        "usecols": ["An", "Lună", "Exporturi autohtone", "Reexporturi"],
+        "ffill": ["An"],
+        "dtypes": {"An": "Int64"},
+        "dropna": ["Lună"],
+        "strip": ["Lună"],
+        "categories": {"Lună": MONTHS},
+    },
+    "Influenta_Export": {
+        "usecols": ["An", "Lună", "Denumire", "Grad"],
+        "ffill": ["An"],
+        "dtypes": {"An": "Int64"},
+        "dropna": ["Lună", "Denumire"],
+    },
+    "Influenta_Import": {
+        "usecols": ["An", "Lună", "Denumire", "Grad"],
+        "ffill": ["An"],
+        "dtypes": {"An": "Int64"},
+        "dropna": ["Lună", "Denumire"],
+    },
+    "Exp_Lunar": {
+        "usecols": ["An", "Lună", "Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"],
+        "ffill": ["An"],
+        "dtypes": {"An": "Int64"},
+        "dropna": ["Lună"],
+        "strip": ["Lună"],
+        "categories": {"Lună": MONTHS},
+    },
+    "Exp_imp_Total": {
+        "usecols": ["An", "Lună", "Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"],
+        "ffill": ["An"],
+        "dtypes": {"An": "Int64"},
+        "dropna": ["Lună"],
+        "strip": ["Lună"],
+        "categories": {"Lună": CUMULATIVE_PERIODS},
+    },
+}
+
+# Foile Import_NCM_* au coloanele redenumite de clean_import_ncm_sheet înainte de aplicarea schemei
+IMPORT_NCM_SCHEMA = {
+    "dropna": ["Cod", "Denumire"],
+    "strip": ["Cod", "Lună", "Denumire"],
+}
+
+
+def to_category(series, order=None):
+    """
+    Convertește o coloană în categorie. Cu `order`, categoria este ordonată după listă;
+    valorile care nu apar în listă nu se pierd, ci sunt adăugate la final.
+    """
+    if order is None:
+        return series.astype("category")
+    present = series.dropna().unique().tolist()
+    extra = sorted((value for value in present if value not in order), key=str)
+    return series.astype(pd.CategoricalDtype(list(order) + extra, ordered=True))
+
+
+def apply_schema(df, schema):
+    """
+    Aplică schema unei foi într-o singură trecere, modificând DataFrame-ul citit în loc.
+    Selecția coloanelor (usecols) este făcută deja la citire, așa că nu mai copiem cadrul pentru proiecție.
+    """
+    usecols = schema.get("usecols")
+    if usecols and list(df.columns) != usecols:
+        df = df.reindex(columns=usecols)
+
+    for col in schema.get("ffill", []):
+        df[col] = df[col].ffill()
+
+    for col, dtype in schema.get("dtypes", {}).items():
+        df[col] = df[col].astype(dtype)
+
+    if schema.get("dropna"):
+        keep = df[schema["dropna"]].notna().all(axis=1)
+        if not keep.all():
+            df.drop(index=df.index[~keep], inplace=True)
+
+    for col in schema.get("strip", []):
+        df[col] = df[col].astype(str).str.strip()
+
+    for col, order in schema.get("categories", {}).items():
+        df[col] = to_category(df[col], order)
+
+    return df
+
+
+def clean_import_ncm_sheet(df_tmp):
+    """Curățarea unei foi Import_NCM_*: denumirea coloanelor și eliminarea rândurilor fără cod/denumire."""
+    # Coloanele de după "Denumire" sunt anii (2022, 2023, ...); îi păstrăm ca text, oricâți ar fi
+    df_tmp.columns = ["Cod", "Lună", "Denumire"] + [str(col) for col in df_tmp.columns[3:]]
+    return apply_schema(df_tmp, IMPORT_NCM_SCHEMA)
+
+
+class ImportNCMSheets(Mapping):
+    """
+    Dicționar leneș {nume foaie: DataFrame} pentru foile Import_NCM_*.
+    O foaie este citită și curățată doar la primul acces (când perioada ei este selectată în pagină).
+    Se păstrează în memorie cel mult `max_cached` foi; cea mai puțin recent folosită este eliminată prima.
+    """
+
+    def __init__(self, file_path, sheet_names, max_cached=4):
+        self._file_path = file_path
+        self._sheet_names = list(sheet_names)
+        self._max_cached = max_cached
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, sheet):
+        if sheet not in self._sheet_names:
+            raise KeyError(sheet)
+        with self._lock:
+            if sheet in self._frames:
+                self._frames.move_to_end(sheet)
+            else:
+                self._frames[sheet] = clean_import_ncm_sheet(read_sheet(self._file_path, sheet))
+                while len(self._frames) > self._max_cached:
+                    self._frames.popitem(last=False)
+            # Obiectul este partajat între sesiuni, deci fiecare apelant primește o copie
+            return self._frames[sheet].copy()
+
+    def __contains__(self, sheet):
+        return sheet in self._sheet_names
+
+    def __iter__(self):
+        return iter(self._sheet_names)
+
+    def __len__(self):
+        return len(self._sheet_names)
+
 
 def load_data(file_path=os.path.join(os.path.dirname(__file__), '../data/Data.xlsx')):
     """
@@ -8,73 +174,37 @@ def load_data(file_path=os.path.join(os.path.dirname(__file__), '../data/Data.xl
     :return: Trei DataFrame-uri - unul pentru datele generale, unul pentru exporturi/reexporturi și unul pentru influența exporturilor
     """
     
-    # Verificăm foile disponibile în fișier
-    sheets = pd.ExcelFile(file_path).sheet_names
-    required_sheets = ["Start_Data", "Exp_Reexp", "Influenta_Export", "Influenta_Import", "Exp_Lunar", "Exp_imp_Total","Import_NCM_I", "Import_NCM_II", "Import_NCM_III","Import_NCM_IV", "Import_NCM_V", "Import_NCM_VI", "Import_NCM_VII", "Import_NCM_VIII","Import_NCM_IX"]
+    required_sheets = list(SHEET_SCHEMAS) + ["Import_NCM_I", "Import_NCM_II", "Import_NCM_III","Import_NCM_IV", "Import_NCM_V", "Import_NCM_VI", "Import_NCM_VII", "Import_NCM_VIII","Import_NCM_IX"]
+
+    sheets = list_sheets(file_path)
 
     # Asigurăm că toate foile necesare există
     for sheet in required_sheets:
         if sheet not in sheets:
             raise ValueError(f"Foaia '{sheet}' nu există în fișierul Excel. Foi disponibile: {sheets}")
 
-    # Încărcăm datele din fiecare foaie
-    df = pd.read_excel(file_path, sheet_name="Start_Data")
-    df_exp_reexp = pd.read_excel(file_path, sheet_name="Exp_Reexp")
-    df_exp_lunar = pd.read_excel(file_path, sheet_name="Exp_Lunar")
-    df_influenta = pd.read_excel(file_path, sheet_name="Influenta_Export")
-    df_influenta_Import = pd.read_excel(file_path, sheet_name="Influenta_Import")
-    df_exp_imp_Total = pd.read_excel(file_path, sheet_name="Exp_imp_Total")
-    
-    # Preprocesare pentru "Start_Data"
-    df["An"] = df["An"].fillna(method="ffill").astype("Int64")
-    df = df.dropna(subset=["Lună", "Țară"])
-    df = df[["An", "Lună", "Țară", "Grupă Țări", "Trimestru", "Semestru", 
-                             "Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"]]
-
-    # Preprocesare pentru "Exp_Reexp"
-    df_exp_reexp["An"] = df_exp_reexp["An"].fillna(method="ffill").astype("Int64")
-    df_exp_reexp = df_exp_reexp.dropna(subset=["Lună"])
-    df_exp_reexp = df_exp_reexp[["An", "Lună", "Exporturi autohtone", "Reexporturi"]]
-
-    # Preprocesare pentru "Influenta_Export"
-    df_influenta["An"] = df_influenta["An"].fillna(method="ffill").astype("Int64")
-    df_influenta = df_influenta.dropna(subset=["Lună", "Denumire"])
-    df_influenta = df_influenta[["An", "Lună", "Denumire", "Grad"]]
-
-    # Preprocesare pentru "Influenta_Import"
-    df_influenta_Import["An"] = df_influenta_Import["An"].fillna(method="ffill").astype("Int64")
-    df_influenta_Import = df_influenta_Import.dropna(subset=["Lună", "Denumire"])
-    df_influenta_Import = df_influenta_Import[["An", "Lună", "Denumire", "Grad"]]
-
-    # Preprocesare pentru "Exp_Lunar"
-    df_exp_lunar["An"] = df_exp_lunar["An"].fillna(method="ffill").astype("Int64")
-    df_exp_lunar = df_exp_lunar.dropna(subset=["Lună"])
-    df_exp_lunar = df_exp_lunar[["An", "Lună", "Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"]]
-
-    # Preprocesare pentru "Exp_imp_Total"
-    df_exp_imp_Total["An"] = df_exp_imp_Total["An"].fillna(method="ffill").astype("Int64")
-    df_exp_imp_Total = df_exp_imp_Total.dropna(subset=["Lună"])
-    df_exp_imp_Total = df_exp_imp_Total[["An", "Lună", "Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"]]
-
-    # Preluăm toate foile relevante pentru Import_NCM
-    sheet_names = [s for s in sheets if s.startswith("Import_NCM_")]
-    df_import_ncm_all = {}
+    # Foile lipsă din cache-ul columnar sunt citite dintr-o singură trecere prin registru,
+    # doar cu coloanele din schemă
+    frames = read_sheets(file_path, {sheet: {"usecols": schema["usecols"]} for sheet, schema in SHEET_SCHEMAS.items()})
+    frames = {sheet: apply_schema(frames[sheet], schema) for sheet, schema in SHEET_SCHEMAS.items()}
+
+    df = frames["Start_Data"]
+    df_exp_reexp = frames["Exp_Reexp"]
+    df_exp_lunar = frames["Exp_Lunar"]
+    df_influenta = frames["Influenta_Export"]
+    df_influenta_Import = frames["Influenta_Import"]
+    df_exp_imp_Total = frames["Exp_imp_Total"]
 
-    for sheet in sheet_names:
-        df_tmp = pd.read_excel(file_path, sheet_name=sheet)
-        df_tmp.columns = ["Cod", "Lună", "Denumire", "2022", "2023", "2024", "2025"]
-        df_tmp = df_tmp.dropna(subset=["Cod", "Denumire"])
-        df_tmp["Cod"] = df_tmp["Cod"].astype(str).str.strip()
-        df_tmp["Lună"] = df_tmp["Lună"].astype(str).str.strip()
-        df_tmp["Denumire"] = df_tmp["Denumire"].astype(str).str.strip()
-        df_import_ncm_all[sheet] = df_tmp
+    # Foile Import_NCM_* sunt descoperite după prefix (se adaugă una nouă în fiecare lună)
+    # și sunt citite abia când pagina cere perioada respectivă
+    sheet_names = [s for s in sheets if s.startswith("Import_NCM_")]
+    df_import_ncm_all = ImportNCMSheets(file_path, sheet_names)
 
     return df, df_exp_reexp, df_influenta, df_influenta_Import, df_exp_lunar, df_exp_imp_Total, df_import_ncm_all
 
 
-def load_forecast_data():
-    path = "data/Model.xlsx"  # ajustează dacă fișierul e în altă locație
-    df_raw = pd.read_excel(path, sheet_name="EX_IM_gap model", header=None)
+def load_forecast_data(path="data/Model.xlsx"):  # ajustează dacă fișierul e în altă locație
+    df_raw = read_sheet(path, "EX_IM_gap model", header=None)
 
     indicatori = [
         "Real exports, mn USD",
@@ -95,3 +225,22 @@ def load_forecast_data():
     df.index = list(range(2000, 2000 + len(df)))
     df.index.name = "An"
     return df
+
+
+def load_bop_data(path="data/BoP-data.xlsx"):
+    df = read_sheet(path, "Selected_data", header=None)
+    df.columns = df.iloc[0]
+    df = df[1:]
+    df = df.rename(columns={df.columns[0]: "Quarter", "Import of goods ": "Import of goods"})
+    df["Year"] = df["Quarter"].str.extract(r'(\d{4})').astype(int)
+    
+
+    df["Quarter_Label"] = df["Quarter"]  # păstrăm denumirea trimestrelor ex: 2015_Q1
+
+    cols = ["Quarter_Label", "Year", "Export of goods", "Import of goods", "Export of services", "Import of services",
+            "Euro-Average of Q", "Gross External Debt", "General government Ext. Debt"]
+    df = df[cols].copy()
+    df = df[df["Year"] >= 2020]
+    for c in cols[2:]:  # începem de la prima coloană numerică
+        df[c] = pd.to_numeric(df[c], errors="coerce")
+    return df.dropna()
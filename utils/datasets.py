@@ -0,0 +1,133 @@
+import os
+import threading
+
+import pandas as pd
+
+from utils.data_loader import load_data, load_forecast_data, load_bop_data
+from utils.excel_cache import read_sheet
+from utils.profiling import section
+from utils.trade_index import TradeIndex
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+# nume set de date -> (funcție de încărcare, fișierele din data/ de care depinde, se livrează printr-o copie superficială)
+_registry = {}
+
+# nume set de date -> (versiunea fișierelor sursă, valoarea încărcată)
+# O singură copie per proces, partajată de toate sesiunile Streamlit.
+_loaded = {}
+
+_registry_lock = threading.Lock()
+_dataset_locks = {}
+
+
+def _data_path(file_name):
+    return os.path.join(DATA_DIR, file_name)
+
+
+def _sources_version(sources):
+    """Versiunea fișierelor sursă: (mtime, mărime) pentru fiecare fișier."""
+    version = []
+    for path in sources:
+        stat = os.stat(path)
+        version.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+def _copy_value(value):
+    """
+    Copie superficială: paginile pot înlocui coloane, adăuga coloane noi sau schimba indexul fără să
+    atingă datele din registru, dar valorile sunt partajate și nu se copiază la fiecare rerulare.
+    O pagină care modifică valori pe loc (df.loc[...] = ..., inplace=True pe o coloană) își face singură .copy().
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    if isinstance(value, tuple):
+        return tuple(_copy_value(v) for v in value)
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    return value
+
+
+def register_dataset(name, loader, *sources, copy=True):
+    """
+    Înregistrează un set de date.
+    :param name: Numele după care paginile cer setul de date
+    :param loader: Funcție fără argumente care întoarce datele
+    :param sources: Fișierele din data/ de care depind datele; o modificare a oricăruia invalidează setul
+    :param copy: False pentru obiectele doar-citire (ex. indexuri), partajate fără nicio copie între sesiuni
+    """
+    with _registry_lock:
+        _registry[name] = (loader, [_data_path(s) for s in sources], copy)
+        _dataset_locks.setdefault(name, threading.Lock())
+        _loaded.pop(name, None)
+
+
+def get_dataset(name):
+    """
+    Întoarce setul de date cerut, printr-o copie superficială (vezi _copy_value).
+    Datele sunt încărcate o singură dată per proces și reîncărcate doar când se schimbă un fișier sursă.
+    """
+    if name not in _registry:
+        raise KeyError(f"Setul de date '{name}' nu este înregistrat. Seturi disponibile: {sorted(_registry)}")
+
+    loader, sources, copy = _registry[name]
+    with section("load", name):
+        with _dataset_locks[name]:
+            version = _sources_version(sources)
+            entry = _loaded.get(name)
+            if entry is None or entry[0] != version:
+                entry = (version, loader())
+                _loaded[name] = entry
+
+        return _copy_value(entry[1]) if copy else entry[1]
+
+
+def invalidate_datasets(name=None):
+    """Golește copia din memorie pentru un set de date sau, fără argument, pentru toate."""
+    with _registry_lock:
+        if name is None:
+            _loaded.clear()
+        else:
+            _loaded.pop(name, None)
+
+
+def _register_sheet(name, file_name, sheet_name, **read_kwargs):
+    register_dataset(name, lambda: read_sheet(_data_path(file_name), sheet_name, **read_kwargs), file_name)
+
+
+# ==========================
+# SETURI DE DATE
+# ==========================
+
+# Sectorul extern (Data.xlsx) – cele șapte obiecte întoarse de load_data
+register_dataset("comert_exterior", lambda: load_data(_data_path("Data.xlsx")), "Data.xlsx")
+
+# Indexul filtrelor din bara laterală (Start_Data); paginile doar citesc din el
+register_dataset(
+    "trade_index", lambda: TradeIndex(get_dataset("comert_exterior")[0]), "Data.xlsx", copy=False
+)
+
+# Prognoză
+register_dataset("model_gap", lambda: load_forecast_data(_data_path("Model.xlsx")), "Model.xlsx")
+register_dataset("bop", lambda: load_bop_data(_data_path("BoP-data.xlsx")), "BoP-data.xlsx")
+
+# Sectorul real
+_register_sheet("real", "Real.xlsx", "Real")
+_register_sheet("real_transport", "Real.xlsx", "Tranport")
+_register_sheet("real_agricultura", "Real.xlsx", "Agricultura")
+_register_sheet("real_pib", "Real.xlsx", "PIB")
+_register_sheet("real_pib_utilizari", "Real.xlsx", "PIB_utilizari")
+_register_sheet("real_industrie", "Real.xlsx", "Industrie")
+_register_sheet("real_industrie_prel", "Real.xlsx", "Industrie_Prel")
+
+# Sectorul monetar și social
+_register_sheet("monetar", "Test_Data_Sector_Monetar.xlsx", "Monetar")
+_register_sheet("social", "Test_Data_Sector_Social.xlsx", "Social")
+
+# Sectorul public
+_register_sheet("venituri", "Test_Data_Venituri_Cheltuieli.xlsx", "Venituri")
+_register_sheet("cheltuieli_f", "Test_Data_Venituri_Cheltuieli.xlsx", "Cheltuieli_F")
+_register_sheet("datoria", "Test_Data_Venituri_Cheltuieli.xlsx", "Datoria")
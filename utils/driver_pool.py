@@ -0,0 +1,145 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+
+def init_driver():
+    """Inițializează un driver Chrome headless pentru scraping."""
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    return webdriver.Chrome(options=options)
+
+
+class DriverPool:
+    """
+    Pool de sesiuni Chrome headless refolosite între pagini.
+    Pornirea browserului domină costul unui scraping, așa că păstrăm câteva sesiuni calde:
+    o sesiune este verificată înainte de a fi dată mai departe, este reciclată după `max_pages` pagini
+    și este închisă la close(). Sesiunile nefolosite de peste `max_idle` secunde sunt închise de un timer
+    în fundal, chiar dacă nu mai urmează niciun scraping (procesul Streamlit rulează mult timp).
+    """
+
+    def __init__(self, size=3, max_pages=25, max_idle=300, factory=init_driver):
+        """
+        :param size: Numărul maxim de browsere deschise simultan
+        :param max_pages: După câte pagini este înlocuită o sesiune (limitează creșterea memoriei Chrome)
+        :param max_idle: După câte secunde de nefolosire este închisă o sesiune din pool
+        :param factory: Funcția care creează un driver nou
+        """
+        self.size = size
+        self.max_pages = max_pages
+        self.max_idle = max_idle
+        self._factory = factory
+        self._slots = threading.BoundedSemaphore(size)
+        # Stivă (driver, pagini încărcate, momentul eliberării): sesiunile cele mai calde sunt refolosite primele
+        self._idle = []
+        self._lock = threading.Lock()
+        # Timerul care închide sesiunile nefolosite; pornit doar cât timp există sesiuni în pool
+        self._reaper = None
+        self._closed = False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    def acquire(self):
+        """Întoarce (driver, pagini încărcate) – o sesiune caldă și sănătoasă sau una nouă."""
+        if self._closed:
+            raise RuntimeError("Pool-ul de browsere a fost închis")
+        self._slots.acquire()
+        try:
+            while True:
+                with self._lock:
+                    entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    return self._factory(), 0
+                driver, pages, released_at = entry
+                if time.monotonic() - released_at <= self.max_idle and self._is_healthy(driver):
+                    return driver, pages
+                self._quit(driver)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, driver, pages, broken=False):
+        """Pune sesiunea înapoi în pool sau o închide dacă este defectă, uzată sau pool-ul s-a închis."""
+        try:
+            if broken or self._closed or pages >= self.max_pages:
+                self._quit(driver)
+            else:
+                with self._lock:
+                    self._idle.append((driver, pages, time.monotonic()))
+                    self._schedule_reaper(self.max_idle)
+        finally:
+            self._slots.release()
+
+    def _schedule_reaper(self, delay):
+        """Pornește timerul de închidere a sesiunilor nefolosite, dacă nu rulează deja (apelat cu _lock luat)."""
+        if self._reaper is None and not self._closed:
+            self._reaper = threading.Timer(delay, self._reap)
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _reap(self):
+        """Închide sesiunile nefolosite de peste max_idle secunde; se reprogramează pentru cele rămase."""
+        now = time.monotonic()
+        with self._lock:
+            self._reaper = None
+            expired = [entry for entry in self._idle if now - entry[2] > self.max_idle]
+            self._idle = [entry for entry in self._idle if now - entry[2] <= self.max_idle]
+            if self._idle:
+                oldest = min(released_at for _, _, released_at in self._idle)
+                self._schedule_reaper(max(self.max_idle - (now - oldest), 0) + 0.1)
+        for driver, _, _ in expired:
+            self._quit(driver)
+
+    @contextmanager
+    def driver(self):
+        """
+        Împrumută o sesiune pentru o pagină; la o eroare WebDriver sesiunea nu mai este refolosită.
+        O așteptare expirată (pagina nu s-a randat) nu înseamnă că sesiunea este defectă.
+        """
+        driver, pages = self.acquire()
+        broken = False
+        try:
+            yield driver
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, pages + 1, broken=broken)
+
+    def close(self):
+        """Închide toate sesiunile din pool; sesiunile împrumutate sunt închise la eliberare."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+        for driver, _, _ in idle:
+            self._quit(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
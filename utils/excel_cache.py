@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Directorul în care păstrăm copiile binare (Parquet) ale foilor Excel
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "data", ".cache")
+
+# Permisiunile copiilor din cache (mkstemp ar lăsa 0600)
+CACHE_FILE_MODE = 0o644
+
+# (cale absolută, mtime, mărime) -> sha1 al conținutului, ca să nu recitim fișierul la fiecare apel
+_hash_memo = {}
+
+
+def _source_digest(file_path):
+    """
+    Întoarce amprenta sha1 a fișierului sursă.
+    Hash-ul se recalculează doar când se schimbă mtime-ul sau mărimea fișierului.
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    digest = _hash_memo.get(key)
+    if digest is None:
+        sha1 = hashlib.sha1()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha1.update(chunk)
+        digest = sha1.hexdigest()
+        _hash_memo[key] = digest
+    return digest
+
+
+def _cache_prefix(file_path, sheet_name, read_kwargs):
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    sheet = re.sub(r"[^\w.-]", "_", str(sheet_name))
+    options = hashlib.sha1(repr(sorted(read_kwargs.items())).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(CACHE_DIR, f"{stem}__{sheet}__{options}__")
+
+
+def _read_cached(prefix, digest):
+    parquet_path = f"{prefix}{digest[:16]}.parquet"
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path)
+    pickle_path = f"{prefix}{digest[:16]}.pkl"
+    if os.path.exists(pickle_path):
+        return pd.read_pickle(pickle_path)
+    return None
+
+
+def _remove_stale(prefix, digest):
+    """Elimină copiile vechi ale aceleiași foi (alt conținut al fișierului sursă)."""
+    directory, base = os.path.split(prefix)
+    for name in os.listdir(directory):
+        if name.startswith(base) and not name.startswith(base + digest[:16]):
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                # Altă sesiune a șters deja fișierul
+                pass
+
+
+@contextmanager
+def _temp_file():
+    """
+    Cale temporară unică în CACHE_DIR (mkstemp), ștearsă la ieșire dacă nu a fost publicată: sesiunile care
+    scriu aceeași foaie în paralel, din același proces, nu își suprascriu fișierul temporar.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=".tmp-")
+    os.close(fd)
+    try:
+        yield tmp_path
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _publish(tmp_path, target):
+    os.chmod(tmp_path, CACHE_FILE_MODE)
+    os.replace(tmp_path, target)
+
+
+def _write_cached(prefix, digest, df):
+    """
+    Scrie foaia în Parquet; dacă pyarrow lipsește sau foaia are coloane mixte
+    (ex. numere și "-") pe care Parquet nu le acceptă fără pierderi, folosim formatul pickle al pandas.
+    Scrierea se face într-un fișier temporar unic urmat de rename, ca cititorii să nu vadă fișiere parțiale.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _remove_stale(prefix, digest)
+
+        target = f"{prefix}{digest[:16]}.parquet"
+        with _temp_file() as tmp_path:
+            try:
+                # Parquet transformă numele de coloane în text; foile cu antet numeric (ex. ani) merg în pickle
+                if not all(isinstance(col, str) for col in df.columns):
+                    raise TypeError("Nume de coloane non-text")
+                df.to_parquet(tmp_path)
+            except (ImportError, ValueError, TypeError, NotImplementedError):
+                target = f"{prefix}{digest[:16]}.pkl"
+                df.to_pickle(tmp_path)
+            _publish(tmp_path, target)
+    except OSError:
+        # Cache-ul este doar o optimizare: dacă directorul nu poate fi scris, continuăm fără el
+        pass
+
+
+def list_sheets(file_path):
+    """Lista foilor din fișierul Excel, citită din cache dacă fișierul nu s-a schimbat."""
+    digest = _source_digest(file_path)
+    prefix = _cache_prefix(file_path, "__sheets__", {})
+    index_path = f"{prefix}{digest[:16]}.json"
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    with pd.ExcelFile(file_path) as xls:
+        sheets = xls.sheet_names
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _remove_stale(prefix, digest)
+        with _temp_file() as tmp_path:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(sheets, f, ensure_ascii=False)
+            _publish(tmp_path, index_path)
+    except OSError:
+        pass
+    return sheets
+
+
+def read_sheets(file_path, sheet_names, **read_kwargs):
+    """
+    Citește mai multe foi dintr-un fișier Excel, folosind cache-ul columnar de pe disc.
+    Foile care lipsesc din cache sunt citite dintr-o singură trecere prin registru și salvate în cache.
+    :param file_path: Calea către fișierul Excel
+    :param sheet_names: Lista foilor de citit sau dicționar {foaie: argumente pd.read_excel specifice foii}
+    :param read_kwargs: Argumente suplimentare pentru pd.read_excel, comune tuturor foilor (ex. header=None)
+    :return: Dicționar {nume foaie: DataFrame}
+    """
+    if not isinstance(sheet_names, dict):
+        sheet_names = {sheet: {} for sheet in sheet_names}
+    sheet_kwargs = {sheet: {**read_kwargs, **kwargs} for sheet, kwargs in sheet_names.items()}
+
+    digest = _source_digest(file_path)
+
+    frames = {}
+    missing = []
+    for sheet, kwargs in sheet_kwargs.items():
+        df = _read_cached(_cache_prefix(file_path, sheet, kwargs), digest)
+        if df is None:
+            missing.append(sheet)
+        else:
+            frames[sheet] = df
+
+    if missing:
+        with pd.ExcelFile(file_path) as xls:
+            for sheet in missing:
+                df = xls.parse(sheet, **sheet_kwargs[sheet])
+                _write_cached(_cache_prefix(file_path, sheet, sheet_kwargs[sheet]), digest, df)
+                frames[sheet] = df
+
+    return {sheet: frames[sheet] for sheet in sheet_kwargs}
+
+
+def read_sheet(file_path, sheet_name, **read_kwargs):
+    """Echivalentul cu cache al pd.read_excel(file_path, sheet_name=...) pentru o singură foaie."""
+    return read_sheets(file_path, [sheet_name], **read_kwargs)[sheet_name]
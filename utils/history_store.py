@@ -0,0 +1,206 @@
+"""
+Istoricul valorilor extrase de scraper-e, pentru toți indicatorii, într-o bază SQLite locală.
+
+Fiecare valoare este identificată prin (indicator, secțiune, perioadă, data actualizării): o actualizare
+reluată nu dublează rândurile, iar o valoare revizuită de BNS la aceeași dată o înlocuiește (upsert).
+Seriile pentru grafice de tendință sunt citite prin index, pe intervale de date, fără a parcurge tot istoricul.
+Lângă fiecare valoare este salvată și perioada ei parsată (utils/periods.py), ca chei numerice de lună.
+
+Importul unui istoric CSV mai vechi (data/istoric_comert.csv), din rădăcina proiectului:
+    python -m utils.history_store data/istoric_comert.csv comert
+"""
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from utils.periods import value_period
+
+HISTORY_DB = "data/istoric_indicatori.sqlite"
+
+# Coloanele cadrului întors de read_history: cele din vechiul istoric CSV, apoi perioada parsată
+# (chei numerice de lună, vezi utils/periods.py; goale dacă eticheta nu conține o perioadă)
+COLUMNS = ["Data actualizare", "Categorie", "Perioada", "Valoare"]
+PERIOD_COLUMNS = ["Început", "Sfârșit", "Bază început", "Bază sfârșit", "Comparație"]
+
+# Coloanele SQL ale perioadei parsate, în ordinea câmpurilor din PeriodLabel
+_PERIOD_FIELDS = [
+    ("perioada_start", "INTEGER"),
+    ("perioada_end", "INTEGER"),
+    ("baza_start", "INTEGER"),
+    ("baza_end", "INTEGER"),
+    ("comparatie", "TEXT"),
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS istoric (
+    indicator TEXT NOT NULL,
+    sectiune TEXT NOT NULL,
+    perioada TEXT NOT NULL,
+    data_actualizare TEXT NOT NULL,
+    valoare REAL NOT NULL,
+    inregistrat_la TEXT NOT NULL,
+    perioada_start INTEGER,
+    perioada_end INTEGER,
+    baza_start INTEGER,
+    baza_end INTEGER,
+    comparatie TEXT,
+    PRIMARY KEY (indicator, sectiune, perioada, data_actualizare)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_istoric_data ON istoric (indicator, data_actualizare);
+"""
+
+# Creat după _migrate, când coloanele perioadei există și într-o bază mai veche
+_PERIOD_INDEX = "CREATE INDEX IF NOT EXISTS idx_istoric_perioada ON istoric (indicator, perioada_end)"
+
+_UPSERT = """
+INSERT INTO istoric (indicator, sectiune, perioada, data_actualizare, valoare, inregistrat_la,
+                     perioada_start, perioada_end, baza_start, baza_end, comparatie)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (indicator, sectiune, perioada, data_actualizare) DO UPDATE
+SET valoare = excluded.valoare, inregistrat_la = excluded.inregistrat_la
+WHERE valoare IS NOT excluded.valoare
+"""
+
+_DATE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+
+# Bazele de date pentru care schema a fost deja verificată în acest proces
+_initialized = set()
+_init_lock = threading.Lock()
+
+
+def normalize_date(data_actualizare):
+    """Data "Actualizat" de pe site (zz.ll.aaaa) în forma ISO aaaa-ll-zz, ca datele să se ordoneze corect."""
+    match = _DATE.search(data_actualizare)
+    if not match:
+        return data_actualizare.strip()
+    day, month, year = match.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def _period_fields(sectiune, perioada):
+    period = value_period(sectiune, perioada)
+    return tuple(period) if period else (None,) * len(_PERIOD_FIELDS)
+
+
+def _migrate(conn):
+    """Adaugă coloanele perioadei parsate într-o bază creată înaintea lor și le completează."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(istoric)")}
+    missing = [(name, sql_type) for name, sql_type in _PERIOD_FIELDS if name not in existing]
+    if not missing:
+        return
+    with conn:
+        for name, sql_type in missing:
+            conn.execute(f"ALTER TABLE istoric ADD COLUMN {name} {sql_type}")
+        labels = conn.execute("SELECT DISTINCT sectiune, perioada FROM istoric").fetchall()
+        conn.executemany(
+            "UPDATE istoric SET " + ", ".join(f"{name} = ?" for name, _ in _PERIOD_FIELDS)
+            + " WHERE sectiune = ? AND perioada = ?",
+            [(*_period_fields(sectiune, perioada), sectiune, perioada) for sectiune, perioada in labels],
+        )
+
+
+def connect(db_path=None):
+    """Conexiune la baza de istoric, cu schema creată la prima folosire."""
+    db_path = db_path or HISTORY_DB
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    with _init_lock:
+        if db_path not in _initialized:
+            # WAL: paginile pot citi istoricul în timp ce un scraper scrie
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            _migrate(conn)
+            conn.execute(_PERIOD_INDEX)
+            _initialized.add(db_path)
+    return conn
+
+
+def record_snapshot(indicator_id, data_actualizare, indicatori, db_path=None):
+    """
+    Adaugă în istoric valorile unei actualizări.
+    :param indicatori: {secțiune: {perioadă: valoare}}, ca în starea salvată a scraper-ului
+    :return: Numărul de valori primite
+    """
+    data = normalize_date(data_actualizare)
+    inregistrat_la = datetime.now().isoformat(timespec="seconds")
+    rows = [
+        (indicator_id, sectiune, perioada, data, valoare, inregistrat_la, *_period_fields(sectiune, perioada))
+        for sectiune, perioade in indicatori.items()
+        for perioada, valoare in perioade.items()
+    ]
+    conn = connect(db_path)
+    try:
+        with conn:
+            conn.executemany(_UPSERT, rows)
+    finally:
+        conn.close()
+    return len(rows)
+
+
+def read_history(indicator_id, sectiune=None, perioada=None, start=None, end=None, db_path=None):
+    """
+    Istoricul unui indicator, ordonat după data actualizării.
+    :param sectiune, perioada: Filtre opționale pe secțiune și pe eticheta perioadei
+    :param start, end: Interval inclusiv pe data actualizării (aaaa-ll-zz sau zz.ll.aaaa)
+    :return: DataFrame cu coloanele COLUMNS + PERIOD_COLUMNS
+    """
+    conditions, params = ["indicator = ?"], [indicator_id]
+    for column, value in (("sectiune", sectiune), ("perioada", perioada)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    if start is not None:
+        conditions.append("data_actualizare >= ?")
+        params.append(normalize_date(start))
+    if end is not None:
+        conditions.append("data_actualizare <= ?")
+        params.append(normalize_date(end))
+
+    query = (
+        "SELECT data_actualizare, sectiune, perioada, valoare, "
+        + ", ".join(name for name, _ in _PERIOD_FIELDS)
+        + " FROM istoric "
+        f"WHERE {' AND '.join(conditions)} ORDER BY data_actualizare, sectiune, perioada"
+    )
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+    history = pd.DataFrame(rows, columns=COLUMNS + PERIOD_COLUMNS)
+    return history.astype({column: "Int64" for column in PERIOD_COLUMNS[:4]})
+
+
+def import_csv(csv_path, indicator_id, db_path=None):
+    """Importă un istoric CSV (Data actualizare, Categorie, Perioada, Valoare); rândurile repetate sunt unificate."""
+    snapshots = {}
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            try:
+                valoare = float(row["Valoare"])
+            except (TypeError, ValueError):
+                continue
+            sectiuni = snapshots.setdefault(row["Data actualizare"], {})
+            sectiuni.setdefault(row["Categorie"], {})[row["Perioada"]] = valoare
+    return sum(
+        record_snapshot(indicator_id, data_actualizare, indicatori, db_path)
+        for data_actualizare, indicatori in snapshots.items()
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("csv_path", help="fișierul CSV cu istoricul")
+    arg_parser.add_argument("indicator", help="id-ul indicatorului din INDICATORS")
+    args = arg_parser.parse_args()
+    print(f"{import_csv(args.csv_path, args.indicator)} valori importate în {HISTORY_DB}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import re
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Cât așteptăm (secunde) răspunsul serverului
+HTTP_TIMEOUT = 15
+
+# Conexiunile keep-alive păstrate per gazdă; acoperă scraper-ele rulate simultan
+POOL_SIZE = 10
+
+# <meta charset="..."> sau <meta http-equiv="Content-Type" content="text/html; charset=...">
+_META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w-]+)", re.I)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Sesiunea HTTP a procesului: conexiuni keep-alive refolosite, conținut comprimat (gzip) acceptat implicit."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=2)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def _decode(response):
+    """
+    Textul răspunsului. Fără charset în Content-Type, requests presupune ISO-8859-1 și strică diacriticele
+    din titluri și perioade, așa că încercăm UTF-8, apoi charset-ul din <meta> și abia apoi detecția automată.
+    """
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        return response.text
+    try:
+        return response.content.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+    meta = _META_CHARSET.search(response.content[:4096])
+    if meta:
+        try:
+            return response.content.decode(meta.group(1).decode("ascii"))
+        except (LookupError, UnicodeDecodeError):
+            # charset necunoscut sau greșit în <meta>
+            pass
+    response.encoding = response.apparent_encoding or "utf-8"
+    return response.text
+
+
+def fetch_html(url, validators=None, timeout=HTTP_TIMEOUT):
+    """
+    Descarcă HTML-ul unei pagini. Cu validatorii răspunsului anterior cererea este condiționată
+    (If-None-Match / If-Modified-Since), iar serverul poate răspunde 304 fără a retrimite pagina.
+    :param validators: {"etag", "last_modified"} salvați la descărcarea anterioară
+    :return: (html sau None dacă serverul a confirmat că pagina nu s-a schimbat, validatorii răspunsului)
+    """
+    validators = validators or {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = get_session().get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and headers:
+        return None, validators
+    response.raise_for_status()
+
+    return _decode(response), {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
@@ -0,0 +1,56 @@
+from utils.scraper import INDICATORS
+from utils.state_store import read_state, state_version
+
+# id indicator -> (versiunea fișierului de stare, rândurile de carduri HTML)
+# Comun tuturor sesiunilor Streamlit din proces; o intrare este înlocuită doar când scraper-ul rescrie starea.
+_cards = {}
+
+
+def format_kpi_value(valoare):
+    if isinstance(valoare, (int, float)):
+        return f"{valoare:,.1f}".replace(",", " ")
+    return str(valoare)
+
+
+def kpi_card_html(sectiune, perioade):
+    """HTML-ul unui card KPI: titlul secțiunii și câte un rând pentru fiecare perioadă."""
+    if not perioade:
+        return (
+            f"**{sectiune}**<br/>"
+            "<span style='font-size:0.85rem;color:#6b7280;'>Nu există valori.</span>"
+        )
+
+    items = "".join(
+        "<div class='kpi-item'>"
+        f"<span class='kpi-period'>{perioada}</span>"
+        f"<span class='kpi-value'>{format_kpi_value(valoare)}</span>"
+        "</div>"
+        for perioada, valoare in perioade.items()
+    )
+    return f"<div class='kpi-card'><div class='kpi-title'>{sectiune}</div>{items}</div>"
+
+
+def indicator_cards(indicator_id):
+    """
+    Cardurile KPI ale unui indicator din INDICATORS, grupate în rânduri de câte cards_per_row.
+    HTML-ul este generat o singură dată per versiune a fișierului de stare, așa că o rerulare a paginii
+    principale doar îl citește din cache.
+    :return: [[html card, ...], ...]; listă goală dacă starea nu conține indicatori,
+        None dacă fișierul de stare lipsește sau este gol
+    """
+    config = INDICATORS[indicator_id]
+    version = state_version(config["state_file"])
+    cached = _cards.get(indicator_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    state = read_state(config["state_file"])
+    if not state:
+        _cards[indicator_id] = (version, None)
+        return None
+    indicatori = state.get("indicatori", {})
+    cards = [kpi_card_html(sectiune, perioade) for sectiune, perioade in indicatori.items()]
+    per_row = config["cards_per_row"]
+    rows = [cards[i:i + per_row] for i in range(0, len(cards), per_row)]
+    _cards[indicator_id] = (version, rows)
+    return rows
@@ -0,0 +1,94 @@
+"""
+Fixture HTML pentru scraper-ele de indicatori: paginile sunt înregistrate o singură dată și apoi
+redate de pe disc, fără rețea și fără Chrome (benchmark-uri, dezvoltare offline, CI).
+
+Modul este ales prin variabile de mediu, citite la fiecare scraping:
+    SCRAPER_FIXTURES=record   – fetch_indicator descarcă pagina ca de obicei și salvează HTML-ul
+    SCRAPER_FIXTURES=replay   – fetch_indicator citește HTML-ul salvat în locul site-ului
+    SCRAPER_FIXTURES_DIR      – directorul fixture-urilor (implicit benchmarks/fixtures)
+
+Înregistrarea tuturor paginilor, din rădăcina proiectului:
+    python -m utils.page_fixtures [id_indicator ...]
+"""
+import argparse
+import os
+
+import requests
+
+from utils.http_client import fetch_html
+
+DEFAULT_FIXTURES_DIR = os.path.join("benchmarks", "fixtures")
+
+MODES = ("", "record", "replay")
+
+
+def fixtures_mode():
+    """Modul curent: "" (site-ul live), "record" sau "replay"."""
+    mode = os.environ.get("SCRAPER_FIXTURES", "").strip().lower()
+    if mode not in MODES:
+        raise ValueError(f"SCRAPER_FIXTURES necunoscut: {mode!r} (valori permise: record, replay)")
+    return mode
+
+
+def fixtures_dir():
+    return os.environ.get("SCRAPER_FIXTURES_DIR") or DEFAULT_FIXTURES_DIR
+
+
+def fixture_path(indicator_id):
+    return os.path.join(fixtures_dir(), f"{indicator_id}.html")
+
+
+def save_fixture(indicator_id, html):
+    path = fixture_path(indicator_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return path
+
+
+def load_fixture(indicator_id):
+    """HTML-ul înregistrat pentru indicator; FileNotFoundError dacă pagina nu a fost înregistrată."""
+    path = fixture_path(indicator_id)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path}: pagina nu a fost înregistrată (python -m utils.page_fixtures {indicator_id})")
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def recorded_indicators():
+    """Indicatorii din INDICATORS pentru care există o pagină înregistrată."""
+    from utils.scraper import INDICATORS
+
+    return [indicator_id for indicator_id in INDICATORS if os.path.exists(fixture_path(indicator_id))]
+
+
+def record(indicator_ids=None):
+    """
+    Descarcă paginile indicatorilor (HTTP, cu Chrome ca rezervă) și le salvează ca fixture-uri,
+    fără a modifica starea salvată a scraper-elor.
+    :return: {id indicator: calea fișierului salvat}
+    """
+    from utils.scraper import INDICATORS, page_html
+
+    paths = {}
+    for indicator_id in indicator_ids or INDICATORS:
+        url = INDICATORS[indicator_id]["url"]
+        try:
+            html, _ = fetch_html(url)
+        except requests.RequestException as e:
+            print(f"{url}: cererea HTTP a eșuat ({e}), folosim browserul.")
+            html = None
+        paths[indicator_id] = save_fixture(indicator_id, page_html(url, html))
+        print(f"{INDICATORS[indicator_id]['label']}: {paths[indicator_id]}")
+    return paths
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("indicatori", nargs="*", help="id-urile din INDICATORS (implicit toate)")
+    args = arg_parser.parse_args()
+    record(args.indicatori)
+
+
+if __name__ == "__main__":
+    main()
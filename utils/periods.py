@@ -0,0 +1,141 @@
+"""
+Parsarea etichetelor de perioadă extrase de scraper-e ("ian.-sep. 2025 / ian.-sep. 2024",
+"trim. II 2025 / trim. II 2024, %", "Anul 2024, lei", "septembrie 2025 / august 2025" ...).
+
+Eticheta devine un PeriodLabel cu chei numerice de lună (an * 12 + lună - 1), calculat o singură dată
+la scrierea în istoric, astfel încât sortarea, comparațiile și intervalele se fac pe numere, nu pe text.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+# start, end        – prima și ultima lună a perioadei (chei numerice), None dacă eticheta are doar o bază
+# base_start, base_end – perioada de comparație ("... / 2023", "2010=100") sau None
+# comparison        – tipul comparației, una dintre COMPARISONS
+PeriodLabel = namedtuple("PeriodLabel", ["start", "end", "base_start", "base_end", "comparison"])
+
+COMPARISONS = (
+    "nivel",               # fără perioadă de comparație
+    "an_anterior",         # aceeași perioadă a anului precedent
+    "luna_anterioara",     # luna precedentă
+    "perioada_anterioara", # perioada precedentă de aceeași lungime (ex. trimestrul precedent)
+    "decembrie_anterior",  # decembrie anului precedent
+    "baza_fixa",           # an de bază fix (ex. 2010=100)
+    "alta",
+)
+
+MONTHS = {
+    "ianuarie": 1, "ian": 1,
+    "februarie": 2, "feb": 2,
+    "martie": 3, "mar": 3,
+    "aprilie": 4, "apr": 4,
+    "mai": 5,
+    "iunie": 6, "iun": 6,
+    "iulie": 7, "iul": 7,
+    "august": 8, "aug": 8,
+    "septembrie": 9, "sept": 9, "sep": 9,
+    "octombrie": 10, "oct": 10,
+    "noiembrie": 11, "noi": 11, "nov": 11,
+    "decembrie": 12, "dec": 12,
+}
+
+_ROMAN = {"I": 1, "II": 2, "III": 3, "IV": 4, "1": 1, "2": 2, "3": 3, "4": 4}
+
+_MONTH = r"\b(?:" + "|".join(sorted(MONTHS, key=len, reverse=True)) + r")\.?"
+_YEAR = r"(?:19|20)\d{2}"
+
+# Formele recunoscute, în ordinea încercării la aceeași poziție din text
+_PERIOD = re.compile(
+    rf"(?P<fixed>{_YEAR})\s*=\s*100"
+    rf"|(?P<from_month>{_MONTH})\s*-\s*(?P<to_month>{_MONTH})\s+(?P<range_year>{_YEAR})"
+    rf"|trim(?:estrul)?\.?\s+(?P<quarter>IV|III|II|I|[1-4])\s+(?P<quarter_year>{_YEAR})"
+    rf"|sem(?:estrul)?\.?\s+(?P<semester>II|I|[12])\s+(?P<semester_year>{_YEAR})"
+    rf"|(?:\d{{1,2}}\s+)?(?P<month>{_MONTH})\s+(?P<month_year>{_YEAR})"
+    rf"|(?<!\d)(?P<year>{_YEAR})(?!\d)",
+    re.IGNORECASE,
+)
+
+
+def month_key(year, month):
+    """Cheia numerică a unei luni: an * 12 + lună - 1."""
+    return year * 12 + month - 1
+
+
+def format_month_key(key):
+    """Cheia numerică a unei luni în forma aaaa-ll."""
+    year, month = divmod(key, 12)
+    return f"{year}-{month + 1:02d}"
+
+
+def _month(text):
+    return MONTHS[text.rstrip(".").lower()]
+
+
+def _span(match):
+    """(prima lună, ultima lună, este bază fixă) pentru forma găsită de _PERIOD."""
+    groups = match.groupdict()
+    if groups["fixed"]:
+        year = int(groups["fixed"])
+        return month_key(year, 1), month_key(year, 12), True
+    if groups["from_month"]:
+        year = int(groups["range_year"])
+        return month_key(year, _month(groups["from_month"])), month_key(year, _month(groups["to_month"])), False
+    if groups["quarter"]:
+        year, quarter = int(groups["quarter_year"]), _ROMAN[groups["quarter"].upper()]
+        return month_key(year, 3 * quarter - 2), month_key(year, 3 * quarter), False
+    if groups["semester"]:
+        year, semester = int(groups["semester_year"]), _ROMAN[groups["semester"].upper()]
+        return month_key(year, 6 * semester - 5), month_key(year, 6 * semester), False
+    if groups["month"]:
+        key = month_key(int(groups["month_year"]), _month(groups["month"]))
+        return key, key, False
+    year = int(groups["year"])
+    return month_key(year, 1), month_key(year, 12), False
+
+
+def _comparison(start, end, base_start, base_end):
+    if (base_start, base_end) == (start - 12, end - 12):
+        return "an_anterior"
+    if base_end == start - 1 and base_end - base_start == end - start:
+        return "luna_anterioara" if start == end else "perioada_anterioara"
+    if base_start == base_end and base_end % 12 == 11 and base_end // 12 == end // 12 - 1:
+        return "decembrie_anterior"
+    return "alta"
+
+
+@lru_cache(maxsize=4096)
+def parse_period(label):
+    """
+    Perioada unei etichete de indicator.
+    :return: PeriodLabel sau None dacă eticheta nu conține o perioadă (ex. "Rata de ocupare, %")
+    """
+    current, _, base = label.partition("/")
+    match = _PERIOD.search(current)
+    if match is None:
+        return None
+    start, end, fixed = _span(match)
+    if fixed:
+        return PeriodLabel(None, None, start, end, "baza_fixa")
+
+    base_match = _PERIOD.search(base) if base else None
+    if base_match is None:
+        return PeriodLabel(start, end, None, None, "nivel")
+    base_start, base_end, _ = _span(base_match)
+    return PeriodLabel(start, end, base_start, base_end, _comparison(start, end, base_start, base_end))
+
+
+def value_period(sectiune, perioada):
+    """
+    Perioada unei valori din starea scraper-ului: din eticheta rândului sau, dacă aceasta nu conține
+    un an al perioadei (ex. "Rata de ocupare, %" sau "2010=100" sub titlul "Trim. II 2025"), din titlul
+    secțiunii. Baza unei etichete ca "2010=100" se păstrează.
+    """
+    period = parse_period(perioada)
+    if period is not None and period.start is not None:
+        return period
+    section_period = parse_period(sectiune)
+    if period is None:
+        return section_period
+    if section_period is None or section_period.start is None:
+        return period
+    return period._replace(start=section_period.start, end=section_period.end)
@@ -0,0 +1,252 @@
+"""
+Profilarea rerulărilor paginilor: timpul și memoria pe secțiuni numite ("load", "transform", "figure", "render").
+
+Profilarea este pornită cu variabila de mediu DASHBOARD_PROFILING=1 (toate sesiunile) sau, pentru o singură
+sesiune, cu parametrul ?profiling=1 în URL. Fără ele, funcțiile de mai jos nu fac nimic.
+    DASHBOARD_PROFILING_MEMORY=1  – măsoară și memoria alocată de Python (tracemalloc; încetinește pagina).
+                                    tracemalloc vede tot procesul, așa că memoria este raportată doar pentru
+                                    rerulările care nu s-au suprapus cu rerularea altei sesiuni
+    DASHBOARD_PROFILING_LOG       – fișierul JSONL în care se adaugă o linie per rerulare (implicit logs/profiling.jsonl)
+
+Într-o pagină:
+    profiling.start_page("Real")
+    profiling.step("load")          # secțiuni consecutive: fiecare step() o închide pe cea anterioară
+    ...
+    with profiling.section("figure", "PIB pe ramuri"):
+        ...
+    profiling.finish_page()         # panoul din bara laterală + linia din jurnal
+
+Ieșirile timpurii din pagină folosesc profiling.stop() în loc de st.stop(), ca și aceste rerulări să fie
+înregistrate.
+
+Încărcările prin get_dataset sunt înregistrate automat ca secțiuni "load".
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+import pandas as pd
+import streamlit as st
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SECTIONS = ("load", "transform", "figure", "render")
+
+DEFAULT_LOG_PATH = os.path.join("logs", "profiling.jsonl")
+
+# Profilul rerulării curente; Streamlit rulează fiecare sesiune în firul ei
+_local = threading.local()
+_log_lock = threading.Lock()
+
+# Rerulările în curs cu DASHBOARD_PROFILING_MEMORY: firul scriptului -> profilul (None dacă sesiunea nu e profilată)
+_running = {}
+_running_lock = threading.Lock()
+
+
+def _env_flag(name):
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "da", "yes")
+
+
+def _query_flag():
+    try:
+        return st.query_params.get("profiling") == "1"
+    except Exception:
+        # În afara unei sesiuni Streamlit (scripturi, benchmark-uri) nu există parametri URL
+        return False
+
+
+class _Profile:
+    def __init__(self, page, memory):
+        self.page = page
+        self.memory = memory
+        self.started = time.perf_counter()
+        self.records = []
+        self.depth = 0
+        self.open_step = None
+        # O altă rerulare a rulat în paralel, deci memoria măsurată nu este doar a acestei rerulări
+        self.overlapped = False
+
+
+def _current():
+    return getattr(_local, "profile", None)
+
+
+def _register(profile):
+    """Înregistrează rerularea curentă; întoarce True dacă mai rulează și altele."""
+    thread = threading.current_thread()
+    with _running_lock:
+        # Firele terminate aparțin rerulărilor încheiate printr-o excepție
+        for other in [t for t in _running if not t.is_alive()]:
+            del _running[other]
+        others = [p for t, p in _running.items() if t is not thread]
+        _running[thread] = profile
+        for other_profile in others:
+            if other_profile is not None:
+                other_profile.overlapped = True
+        return bool(others)
+
+
+def _unregister():
+    with _running_lock:
+        _running.pop(threading.current_thread(), None)
+
+
+def start_page(page):
+    """Începe profilul rerulării curente a paginii (dacă profilarea este pornită)."""
+    memory = _env_flag("DASHBOARD_PROFILING_MEMORY")
+    profile = _Profile(page, memory) if _env_flag("DASHBOARD_PROFILING") or _query_flag() else None
+    _local.profile = profile
+    if not memory:
+        return
+    overlapped = _register(profile)
+    if profile is None:
+        return
+    if overlapped:
+        # reset_peak ar strica vârful măsurat de rerularea aflată deja în curs
+        profile.overlapped = True
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+
+@contextmanager
+def section(name, label=None):
+    """
+    Măsoară blocul ca secțiune a profilului curent: timp (ms) și, cu DASHBOARD_PROFILING_MEMORY,
+    memoria Python rămasă alocată după bloc (KB). Secțiunile se pot imbrica.
+    :param name: Tipul secțiunii, de preferat unul din SECTIONS
+    :param label: Detaliu afișat lângă tip (ex. numele setului de date)
+    """
+    profile = _current()
+    if profile is None:
+        yield
+        return
+
+    record = {"section": name, "label": label, "depth": profile.depth}
+    profile.records.append(record)
+    memory_before = tracemalloc.get_traced_memory()[0] if profile.memory and tracemalloc.is_tracing() else None
+    profile.depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record["ms"] = round((time.perf_counter() - start) * 1000, 2)
+        profile.depth -= 1
+        if memory_before is not None:
+            record["mem_kb"] = round((tracemalloc.get_traced_memory()[0] - memory_before) / 1024, 1)
+
+
+def profiled(name, label=None):
+    """Decorator: fiecare apel al funcției este o secțiune (eticheta implicită este numele funcției)."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with section(name, label or func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _close_step(profile):
+    if profile.open_step is not None:
+        profile.open_step.__exit__(None, None, None)
+        profile.open_step = None
+
+
+def step(name, label=None):
+    """Închide secțiunea deschisă de step()-ul anterior și deschide una nouă, până la următorul step() sau finish_page()."""
+    profile = _current()
+    if profile is None:
+        return
+    _close_step(profile)
+    profile.open_step = section(name, label)
+    profile.open_step.__enter__()
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss este în KB pe Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def _write_log(entry):
+    path = os.environ.get("DASHBOARD_PROFILING_LOG") or DEFAULT_LOG_PATH
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    line = json.dumps(entry, ensure_ascii=False)
+    with _log_lock:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def _render_panel(entry):
+    records = pd.DataFrame(entry["sections"])
+    with st.sidebar.expander(f"Profilare: {entry['total_ms']:.0f} ms", expanded=False):
+        top_level = records[records["depth"] == 0] if not records.empty else records
+        if not top_level.empty:
+            summary = top_level.groupby("section", sort=False)["ms"].sum()
+            other = entry["total_ms"] - summary.sum()
+            if other > 0:
+                summary["alte"] = round(other, 2)
+            st.bar_chart(summary)
+        if not records.empty:
+            records["secțiune"] = ["  " * depth + name for depth, name in zip(records["depth"], records["section"])]
+            st.dataframe(records.drop(columns=["section", "depth"]).set_index("secțiune"), use_container_width=True)
+        details = [f"total {entry['total_ms']:.0f} ms"]
+        if entry.get("stopped"):
+            details.append("pagina s-a oprit înainte de final")
+        if entry.get("memory_overlapped"):
+            details.append("memorie nemăsurată: altă sesiune a rulat în paralel")
+        if entry.get("peak_kb") is not None:
+            details.append(f"vârf memorie Python {entry['peak_kb'] / 1024:.1f} MB")
+        if entry.get("rss_mb") is not None:
+            details.append(f"RSS maxim al procesului {entry['rss_mb']:.0f} MB")
+        st.caption(", ".join(details))
+
+
+def finish_page(stopped=False):
+    """
+    Încheie profilul rerulării: adaugă linia în jurnalul JSONL și afișează panoul din bara laterală.
+    :param stopped: True dacă pagina se oprește înainte de final (vezi stop())
+    """
+    profile = _current()
+    _unregister()
+    if profile is None:
+        return
+    _close_step(profile)
+    _local.profile = None
+
+    entry = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "page": profile.page,
+        "total_ms": round((time.perf_counter() - profile.started) * 1000, 2),
+        "sections": profile.records,
+        "rss_mb": _peak_rss_mb(),
+    }
+    if stopped:
+        entry["stopped"] = True
+    if profile.memory:
+        if profile.overlapped:
+            # Alocările altor sesiuni sunt amestecate în cifre; nu le raportăm ca fiind ale acestei rerulări
+            for record in profile.records:
+                record.pop("mem_kb", None)
+            entry["memory_overlapped"] = True
+        else:
+            entry["peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    _write_log(entry)
+    _render_panel(entry)
+
+
+def stop():
+    """st.stop() pentru paginile profilate: rerularea oprită devreme este totuși înregistrată."""
+    finish_page(stopped=True)
+    st.stop()
@@ -0,0 +1,228 @@
+"""
+Actualizarea indicatorilor în fundal, separat de rerulările paginilor Streamlit: paginile doar citesc
+starea salvată (data/ultima_actualizare_*.json), iar scraper-ele rulează după un program, cu
+abatere aleatoare (jitter) și reîncercări cu așteptare exponențială pentru indicatorii care eșuează.
+
+Din linia de comandă, din rădăcina proiectului:
+    python -m utils.refresher --once [id_indicator ...]   – o singură actualizare (cod 1 dacă un indicator eșuează)
+    python -m utils.refresher --interval 21600            – actualizare la fiecare 6 ore, până la Ctrl+C
+
+În aplicație, get_refresher() pornește firul de actualizare al procesului; cu variabila de mediu
+INDICATORI_REFRESH_INTERVAL (secunde) firul actualizează periodic, altfel doar la cerere (request_refresh).
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+from utils.scraper import INDICATORS, fetch_all
+
+# Intervalul implicit al actualizărilor programate din linia de comandă (secunde)
+DEFAULT_INTERVAL = 6 * 3600
+
+# Abaterea aleatoare a fiecărei programări, ca fracție din întârziere (0.1 = ±10%)
+DEFAULT_JITTER = 0.1
+
+# Prima reîncercare după o eroare și plafonul așteptării exponențiale (secunde)
+RETRY_DELAY = 60
+MAX_BACKOFF = 3600
+
+
+class Refresher:
+    """
+    Programatorul actualizărilor: fiecare indicator are propria scadență. După un succes următoarea
+    actualizare este programată peste `interval` secunde; după o eroare, reîncercarea vine după
+    retry_delay, 2 × retry_delay, ... cel mult max_backoff secunde. Toate întârzierile primesc jitter,
+    ca actualizările să nu lovească site-ul simultan; și prima actualizare programată a fiecărui indicator
+    este decalată aleator cu cel mult jitter × interval.
+    """
+
+    def __init__(self, interval=None, jitter=DEFAULT_JITTER, retry_delay=RETRY_DELAY, max_backoff=MAX_BACKOFF,
+                 indicator_ids=None, force=False, fetch=fetch_all):
+        """
+        :param interval: Secundele dintre actualizările reușite; None = doar la cerere (request_refresh)
+        :param jitter: Abaterea aleatoare a întârzierilor, ca fracție (0.1 = ±10%)
+        :param retry_delay: Prima reîncercare după o eroare; se dublează la fiecare eroare consecutivă
+        :param max_backoff: Întârzierea maximă a reîncercărilor
+        :param indicator_ids: Indicatorii actualizați (implicit toți din INDICATORS)
+        :param force: Parsează paginile chiar dacă par neschimbate
+        :param fetch: Funcția care rulează scraper-ele (semnătura lui fetch_all)
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self.retry_delay = retry_delay
+        self.max_backoff = max_backoff
+        self.indicator_ids = list(indicator_ids or INDICATORS)
+        self.force = force
+        self._fetch = fetch
+
+        # Ultimul rezultat al fiecărui indicator (vezi fetch_all) și momentul ultimei actualizări;
+        # modificate de firul de fundal sub _lock, paginile le citesc prin report()
+        self.last_report = {}
+        self.last_run = None
+        self.running = False
+
+        # Scadența fiecărui indicator (time.monotonic) sau None dacă nu este programat
+        now = time.monotonic()
+        self._next_run = {
+            indicator_id: now + random.uniform(0, jitter) * interval if interval is not None else None
+            for indicator_id in self.indicator_ids
+        }
+        self._failures = {indicator_id: 0 for indicator_id in self.indicator_ids}
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _jittered(self, delay):
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _schedule(self, raport):
+        now = time.monotonic()
+        with self._lock:
+            for indicator_id, rezultat in raport.items():
+                if rezultat["status"] == "eroare":
+                    self._failures[indicator_id] += 1
+                    delay = min(self.retry_delay * 2 ** (self._failures[indicator_id] - 1), self.max_backoff)
+                else:
+                    self._failures[indicator_id] = 0
+                    delay = self.interval
+                self._next_run[indicator_id] = now + self._jittered(delay) if delay is not None else None
+
+    def run_once(self, indicator_ids=None):
+        """Rulează acum scraper-ele indicatorilor dați (implicit toți) și reprogramează-i."""
+        with self._run_lock:
+            self.running = True
+            try:
+                raport = self._fetch(indicator_ids=indicator_ids or self.indicator_ids, force=self.force)
+            finally:
+                self.running = False
+        self._schedule(raport)
+        with self._lock:
+            self.last_report.update(raport)
+            self.last_run = time.time()
+        return raport
+
+    def report(self):
+        """
+        Copie a ultimului raport, sigură de citit cât timp firul de fundal actualizează.
+        :return: (momentul ultimei actualizări sau None, [rezultat fetch_all, ...])
+        """
+        with self._lock:
+            return self.last_run, list(self.last_report.values())
+
+    def _due(self):
+        now = time.monotonic()
+        with self._lock:
+            return [
+                indicator_id for indicator_id, due in self._next_run.items()
+                if due is not None and due <= now
+            ]
+
+    def _seconds_to_next(self):
+        """Secundele până la următoarea scadență; None dacă nimic nu este programat."""
+        with self._lock:
+            scheduled = [due for due in self._next_run.values() if due is not None]
+        return max(0.0, min(scheduled) - time.monotonic()) if scheduled else None
+
+    def run_forever(self):
+        """Bucla programatorului; se oprește la stop()."""
+        while not self._stop.is_set():
+            if self._wake.is_set():
+                # running devine True înainte de ștergerea cererii, ca busy să nu treacă prin False
+                # între cererea de actualizare și pornirea ei
+                self.running = True
+                self._wake.clear()
+                due = self.indicator_ids
+            else:
+                due = self._due()
+            if due:
+                try:
+                    self.run_once(due)
+                except Exception as e:
+                    # fetch_all izolează erorile fiecărui indicator; aici ajung doar erorile neașteptate
+                    print(f"Actualizarea indicatorilor a eșuat: {type(e).__name__}: {e}")
+                    self._schedule({indicator_id: {"status": "eroare"} for indicator_id in due})
+                continue
+            self._wake.wait(self._seconds_to_next())
+
+    def start(self):
+        """Pornește bucla într-un fir de fundal (o singură dată)."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self.run_forever, name="refresher", daemon=True)
+                self._thread.start()
+        return self
+
+    def request_refresh(self):
+        """Cere o actualizare a tuturor indicatorilor cât mai curând, fără a aștepta terminarea ei."""
+        self._wake.set()
+        self.start()
+
+    @property
+    def busy(self):
+        """True cât timp o actualizare cerută rulează sau așteaptă să pornească."""
+        return self.running or self._wake.is_set()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def get_refresher():
+    """
+    Programatorul procesului, comun tuturor sesiunilor Streamlit. Cu INDICATORI_REFRESH_INTERVAL
+    actualizează periodic; altfel firul pornește la prima cerere de actualizare.
+    """
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            interval = os.environ.get("INDICATORI_REFRESH_INTERVAL")
+            _refresher = Refresher(interval=float(interval) if interval else None)
+            if interval:
+                _refresher.start()
+    return _refresher
+
+
+def print_report(raport):
+    for rezultat in raport.values():
+        eroare = f" – {rezultat['eroare']}" if rezultat["eroare"] else ""
+        print(f"{rezultat['label']}: {rezultat['status']} ({rezultat['durata']:.1f} s){eroare}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("indicatori", nargs="*", help="id-urile din INDICATORS (implicit toate)")
+    arg_parser.add_argument("--once", action="store_true", help="o singură actualizare, apoi ieșire")
+    arg_parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="secundele dintre actualizări")
+    arg_parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER, help="abaterea aleatoare a programărilor (fracție)")
+    arg_parser.add_argument("--force", action="store_true", help="parsează paginile chiar dacă par neschimbate")
+    args = arg_parser.parse_args()
+    unknown = [indicator_id for indicator_id in args.indicatori if indicator_id not in INDICATORS]
+    if unknown:
+        arg_parser.error(f"indicatori necunoscuți: {', '.join(unknown)} (disponibili: {', '.join(INDICATORS)})")
+
+    refresher = Refresher(interval=args.interval, jitter=args.jitter, indicator_ids=args.indicatori or None, force=args.force)
+    if args.once:
+        raport = refresher.run_once()
+        print_report(raport)
+        sys.exit(1 if any(rezultat["eroare"] for rezultat in raport.values()) else 0)
+
+    try:
+        refresher.run_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
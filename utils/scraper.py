@@ -0,0 +1,468 @@
+import atexit
+import hashlib
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html import unescape
+
+import requests
+from bs4 import BeautifulSoup, Tag
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.driver_pool import DriverPool
+from utils.http_client import fetch_html
+from utils.history_store import record_snapshot
+from utils.page_fixtures import fixtures_mode, load_fixture, save_fixture
+from utils.state_store import locked, read_state, write_state
+
+# ==========================
+# CONSTANTE & PATH-URI
+# ==========================
+
+BASE_URL = "https://statistica.gov.md/ro/statistic_indicator_details"
+
+# Registrul indicatorilor descărcați de pe statistica.gov.md; un indicator nou este o intrare nouă aici
+# (plus locul lui în LAYOUT din pages/Main.py). Ordinea este și ordinea din raportul de actualizare.
+# Fiecare actualizare este adăugată și în istoricul comun al indicatorilor (utils/history_store.py).
+#   label           – numele folosit în jurnal și în raportul de actualizare
+#   title           – titlul secțiunii de pe pagina principală
+#   url             – pagina indicatorului
+#   state_file      – fișierul JSON cu ultima stare descărcată
+#   default_section – titlul tabelelor fără titlu propriu (vezi parse_indicator_tables)
+#   cards_per_row   – câte carduri KPI afișează secțiunea pe un rând
+#   heading         – opțional, "subheader" pentru un titlu st.subheader în loc de markdown "### ..."
+#   missing_state   – opțional, avertismentul afișat (în locul secțiunii) când fișierul de stare lipsește sau e gol
+#   no_data         – opțional, mesajul afișat când starea există, dar nu conține indicatori
+INDICATORS = {
+    "comert": {
+        "label": "Comerț",
+        "title": "Comerț internațional",
+        "url": f"{BASE_URL}/19",
+        "state_file": "data/ultima_actualizare.json",
+        "default_section": None,
+        "cards_per_row": 3,
+        "heading": "subheader",
+        "missing_state": (
+            "Nu am găsit fișierul de stare pentru comerțul exterior "
+            "`data/ultima_actualizare.json`. Rulează actualizarea din sidebar."
+        ),
+        "no_data": "Fișierul JSON nu conține indicatori de comerț. Verifică scriptul de scraping.",
+    },
+    "pib": {
+        "label": "PIB",
+        "title": "PIB",
+        "url": f"{BASE_URL}/12",
+        "state_file": "data/ultima_actualizare_pib.json",
+        "default_section": None,
+        "cards_per_row": 1,
+    },
+    "investitii": {
+        "label": "Investiții",
+        "title": "Investiții în active imobilizate",
+        "url": f"{BASE_URL}/16",
+        "state_file": "data/ultima_actualizare_investitii.json",
+        "default_section": None,
+        "cards_per_row": 1,
+    },
+    "ipc": {
+        "label": "IPC",
+        "title": "Indicele prețurilor de consum (IPC)",
+        "url": f"{BASE_URL}/10",
+        "state_file": "data/ultima_actualizare_cpi.json",
+        "default_section": "Indicele prețurilor de consum (IPC)",
+        "cards_per_row": 1,
+    },
+    "populatie": {
+        "label": "Populație",
+        "title": "Populație și demografie",
+        "url": f"{BASE_URL}/25",
+        "state_file": "data/ultima_actualizare_populatie.json",
+        "default_section": "Populație și demografie",
+        "cards_per_row": 1,
+    },
+    "forta_munca": {
+        "label": "Forța de muncă",
+        "title": "Forța de muncă și șomaj",
+        "url": f"{BASE_URL}/1",
+        "state_file": "data/ultima_actualizare_forta_munca.json",
+        "default_section": "Forța de muncă și șomaj",
+        "cards_per_row": 1,
+    },
+    "castiguri": {
+        "label": "Câștiguri",
+        "title": "Câștigul salarial și costul forței de muncă",
+        "url": f"{BASE_URL}/2",
+        "state_file": "data/ultima_actualizare_castiguri.json",
+        "default_section": "Câștigul salarial și costul forței de muncă",
+        "cards_per_row": 1,
+    },
+    "industrie": {
+        "label": "Industrie",
+        "title": "Industrie",
+        "url": f"{BASE_URL}/13",
+        "state_file": "data/ultima_actualizare_industrie.json",
+        "default_section": "Producția industrială",
+        "cards_per_row": 1,
+    },
+    "agricultura": {
+        "label": "Agricultură",
+        "title": "Agricultură",
+        "url": f"{BASE_URL}/15",
+        "state_file": "data/ultima_actualizare_agricultura.json",
+        "default_section": "Producția agricolă",
+        "cards_per_row": 1,
+    },
+}
+
+# Numărul implicit de scraper-e rulate simultan, egal cu numărul de browsere din pool
+MAX_WORKERS = 3
+
+# Cât așteptăm (secunde) ca pagina să afișeze tabelele cu indicatori sau data actualizării
+PAGE_TIMEOUT = 15
+
+# Backend-ul de parsare HTML: arborele lxml (C), fără BeautifulSoup, dacă lxml este instalat;
+# altfel BeautifulSoup cu parserul din biblioteca standard
+try:
+    import lxml.html
+    HTML_BACKEND = "lxml"
+except ImportError:
+    HTML_BACKEND = "html.parser"
+
+# Verificarea ieftină, pe HTML-ul brut, că pagina conține tabele
+_TABLE_TAG = re.compile(r"<table[\s>]", re.IGNORECASE)
+
+# Tot ce nu ține de un număr (spații, separatoare de mii, unități) este eliminat din valorile tabelelor
+_NON_NUMERIC = re.compile(r"[^0-9\.\-]")
+
+# Pagina este gata când apare un tabel cu indicatori sau textul "Actualizat"
+PAGE_READY = EC.any_of(
+    EC.presence_of_element_located((By.CSS_SELECTOR, "table.tablekeyvalue")),
+    EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Actualizat')]")),
+)
+
+
+# ==========================
+# FUNCȚII GENERALE
+# ==========================
+
+# Pool-ul de browsere al procesului, creat la prima pagină descărcată și închis la ieșire
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = DriverPool(size=MAX_WORKERS)
+            atexit.register(_driver_pool.close)
+    return _driver_pool
+
+
+def load_page(url, timeout=PAGE_TIMEOUT):
+    """
+    Încarcă pagina într-o sesiune Chrome din pool și întoarce HTML-ul randat.
+    Nu așteptăm un timp fix: HTML-ul este citit imediat ce pagina afișează indicatorii.
+    :param timeout: Secundele după care renunțăm; o pagină care nu se randează ridică TimeoutException
+    """
+    with get_driver_pool().driver() as driver:
+        driver.get(url)
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            PAGE_READY, message=f"{url}: indicatorii nu au apărut în {timeout} s"
+        )
+        return driver.page_source
+
+
+def parse_document(html, backend=None):
+    """
+    Construiește arborele paginii: elementul rădăcină lxml sau, fără lxml, un BeautifulSoup.
+    get_data_actualizare și parse_indicator_tables acceptă ambele tipuri de arbori.
+    :param backend: "lxml" sau un parser BeautifulSoup ("html.parser"); implicit HTML_BACKEND
+    """
+    backend = backend or HTML_BACKEND
+    if backend == "lxml":
+        return lxml.html.document_fromstring(html)
+    return BeautifulSoup(html, backend)
+
+
+def page_html(url, html=None):
+    """
+    HTML-ul paginii cu indicatori. Tabelele sunt randate de server, așa că folosim HTML-ul descărcat prin HTTP;
+    Chrome este folosit doar dacă cererea HTTP a eșuat (html=None) sau HTML-ul brut nu conține tabele.
+    """
+    if html is not None:
+        # Aceeași condiție ca în parse_indicator_tables: tabele "tablekeyvalue" sau, în lipsa lor, orice tabel
+        if _TABLE_TAG.search(html):
+            return html
+        print(f"{url}: tabelele lipsesc din HTML-ul brut, folosim browserul.")
+    return load_page(url)
+
+
+def load_json_state(path):
+    """Starea salvată a unui scraper ({} dacă lipsește); citirile repetate ale unui fișier neschimbat vin din cache."""
+    return read_state(path)
+
+
+def save_json_state(path, data):
+    """Scrie starea atomic (vezi utils/state_store.py)."""
+    write_state(path, data)
+
+
+def get_data_actualizare(doc):
+    """
+    Caută textul care conține 'Actualizat' și întoarce data ca string.
+    Dacă nu găsește nimic, întoarce 'Fără dată actualizare' ca să nu blocheze salvarea JSON-ului.
+    :param doc: Arborele paginii, construit cu parse_document (lxml sau BeautifulSoup)
+    """
+    if isinstance(doc, Tag):
+        actualizare_tag = doc.find(string=lambda t: t and "Actualizat" in t)
+    else:
+        actualizare_tag = next((t for t in doc.itertext() if "Actualizat" in t), None)
+    if not actualizare_tag:
+        return "Fără dată actualizare"
+
+    text = actualizare_tag.strip()
+    if ":" in text:
+        parts = text.split(":", 1)
+        return parts[1].strip() or "Fără dată actualizare"
+    return text or "Fără dată actualizare"
+
+
+def get_data_actualizare_raw(html):
+    """
+    Varianta ieftină a get_data_actualizare, direct pe HTML-ul brut, fără a construi arborele BeautifulSoup.
+    Întoarce None dacă data nu poate fi citită așa; atunci decide parsarea completă.
+    """
+    start = html.find("Actualizat")
+    if start == -1:
+        return None
+    end = html.find("<", start)
+    text = unescape(html[start:end] if end != -1 else html[start:]).strip()
+    if ":" not in text:
+        return None
+    return text.split(":", 1)[1].strip() or None
+
+
+def _is_title_or_table(tag):
+    """Elementele urmărite la parcurgerea paginii: titlurile de secțiune <div class="font-18"> și tabelele."""
+    return tag.name == "table" or (tag.name == "div" and "font-18" in tag.get("class", ()))
+
+
+def _lxml_text(el):
+    """Echivalentul lxml pentru get_text(strip=True) din BeautifulSoup."""
+    return "".join(text.strip() for text in el.itertext())
+
+
+def _bs4_rows(table):
+    for row in table.find_all("tr"):
+        cols = row.find_all("td")
+        if len(cols) >= 2:
+            yield cols[0].get_text(strip=True), cols[1].get_text(strip=True)
+
+
+def _lxml_rows(table):
+    for row in table.iter("tr"):
+        cols = list(row.iter("td"))
+        if len(cols) >= 2:
+            yield _lxml_text(cols[0]), _lxml_text(cols[1])
+
+
+def _iter_page(doc):
+    """
+    Parcurge documentul o singură dată, în ordine, și întoarce pentru fiecare element urmărit:
+    ("title", textul titlului, None) sau ("table", clasele tabelului, rândurile (etichetă, valoare brută)).
+    """
+    if isinstance(doc, Tag):
+        for tag in doc.find_all(_is_title_or_table):
+            if tag.name == "div":
+                yield "title", (tag.find("b") or tag).get_text(strip=True), None
+            else:
+                yield "table", tag.get("class", ()), _bs4_rows(tag)
+    else:
+        for el in doc.iter("div", "table"):
+            classes = el.get("class", "").split()
+            if el.tag == "table":
+                yield "table", classes, _lxml_rows(el)
+            elif "font-18" in classes:
+                yield "title", _lxml_text(next(el.iter("b"), el)), None
+
+
+def _has_keyvalue_table(doc):
+    if isinstance(doc, Tag):
+        return doc.select_one("table.tablekeyvalue") is not None
+    return any("tablekeyvalue" in table.get("class", "").split() for table in doc.iter("table"))
+
+
+def parse_indicator_tables(doc, default_section=None):
+    """
+    Citește tabelele cu indicatori și întoarce un dict:
+    { 'Titlu secțiune': { 'Etichetă (perioadă/indicator)': valoare_float, ... }, ... }
+
+    doc – arborele paginii, construit cu parse_document (lxml sau BeautifulSoup).
+    default_section – nume folosit dacă nu găsim un titlu <div class="font-18"> înainte de tabel.
+
+    Documentul este parcurs o singură dată, în ordine, ținând minte ultimul titlu de secțiune întâlnit,
+    în loc să căutăm înapoi titlul pentru fiecare tabel.
+    """
+    indicatori = {}
+
+    # Folosim tabelele de tip "tablekeyvalue"; dacă pagina nu are niciunul, folosim toate tabelele
+    only_keyvalue = _has_keyvalue_table(doc)
+
+    # Titlul secțiunii e, de obicei, în <div class="font-18"><b>...</b></div>
+    current_title = None
+
+    for kind, value, rows in _iter_page(doc):
+        if kind == "title":
+            current_title = value
+            continue
+
+        if only_keyvalue and "tablekeyvalue" not in value:
+            continue
+
+        if current_title is not None:
+            sectiune = current_title
+        elif default_section:
+            sectiune = default_section
+        else:
+            continue
+
+        valori = indicatori.setdefault(sectiune, {})
+
+        for perioada, raw_value in rows:
+            # curățăm valoarea: spații (inclusiv \xa0), virgula zecimală, unități etc.
+            raw_value_clean = _NON_NUMERIC.sub("", raw_value.replace(",", "."))
+
+            if not raw_value_clean:
+                continue
+
+            try:
+                valoare = float(raw_value_clean)
+            except ValueError:
+                continue
+
+            valori[perioada] = valoare
+
+    return indicatori
+
+
+# ==========================
+# SCRAPER GENERIC
+# ==========================
+
+def fetch_indicator(indicator_id, force=False):
+    """
+    Descarcă pagina unui indicator din INDICATORS și salvează starea dacă data actualizării s-a schimbat.
+    Cele mai multe actualizări programate nu găsesc nimic nou, așa că înainte de parsare încercăm
+    verificări ieftine, în ordine: cererea condiționată (HTTP 304), amprenta HTML-ului și data
+    "Actualizat" citită din HTML-ul brut.
+    Cu SCRAPER_FIXTURES=replay pagina este citită din fixture-ul înregistrat, iar cu SCRAPER_FIXTURES=record
+    pagina descărcată este salvată ca fixture (vezi utils/page_fixtures.py).
+    Actualizările aceluiași indicator sunt serializate (și între procese), ca două actualizări
+    simultane să nu compare și să scrie starea în paralel.
+    :param force: Ignoră starea salvată și parsează pagina oricum
+    :return: Indicatorii noi sau None dacă datele nu s-au schimbat ori nu au putut fi extrase
+    """
+    with locked(INDICATORS[indicator_id]["state_file"]):
+        return _fetch_indicator(indicator_id, force)
+
+
+def _fetch_indicator(indicator_id, force):
+    config = INDICATORS[indicator_id]
+    label = config["label"]
+    url = config["url"]
+
+    mode = fixtures_mode()
+
+    last_state = load_json_state(config["state_file"])
+    # Verificările rapide au sens doar dacă avem deja indicatori salvați; la înregistrare vrem pagina completă
+    known = last_state if last_state.get("indicatori") and not force and mode != "record" else {}
+
+    html, validators = None, {}
+    if mode == "replay":
+        html = load_fixture(indicator_id)
+    else:
+        try:
+            html, validators = fetch_html(url, known.get("http"))
+            if html is None:
+                print(f"ℹ {label}: pagina nu s-a schimbat (HTTP 304). Ultima actualizare:", known["data_actualizare"])
+                return None
+        except requests.RequestException as e:
+            print(f"{url}: cererea HTTP a eșuat ({e}), folosim browserul.")
+
+    content_hash = None
+    if html is not None:
+        content_hash = hashlib.sha1(html.encode("utf-8")).hexdigest()
+        if known and (
+            content_hash == known.get("content_hash")
+            or get_data_actualizare_raw(html) == known["data_actualizare"]
+        ):
+            # Păstrăm validatorii și amprenta noi, ca următoarea verificare să fie un simplu 304
+            if (known.get("http"), known.get("content_hash")) != (validators, content_hash):
+                save_json_state(config["state_file"], {**known, "http": validators, "content_hash": content_hash})
+            print(f"ℹ {label}: datele nu s-au schimbat. Ultima actualizare:", known["data_actualizare"])
+            return None
+
+    if mode != "replay":
+        html = page_html(url, html)
+        if mode == "record":
+            save_fixture(indicator_id, html)
+    doc = parse_document(html)
+
+    data_actualizare = get_data_actualizare(doc)
+
+    if known.get("data_actualizare") == data_actualizare:
+        print(f"ℹ {label}: datele nu s-au schimbat. Ultima actualizare:", data_actualizare)
+        return None
+
+    indicatori = parse_indicator_tables(doc, default_section=config["default_section"])
+    if not indicatori:
+        print(f"{label}: nu s-au putut extrage indicatorii.")
+        return None
+
+    record_snapshot(indicator_id, data_actualizare, indicatori)
+    save_json_state(config["state_file"], {
+        "data_actualizare": data_actualizare,
+        "indicatori": indicatori,
+        "http": validators,
+        "content_hash": content_hash,
+    })
+    print(f"{label}: date actualizate la {data_actualizare}")
+    return indicatori
+
+
+# ==========================
+# ORCHESTRATOR
+# ==========================
+
+def _run_scraper(indicator_id, force=False):
+    label = INDICATORS[indicator_id]["label"]
+    start = time.perf_counter()
+    try:
+        indicatori = fetch_indicator(indicator_id, force=force)
+        rezultat = {"label": label, "status": "actualizat" if indicatori else "fără date noi", "eroare": None}
+    except Exception as e:
+        rezultat = {"label": label, "status": "eroare", "eroare": f"{type(e).__name__}: {e}"}
+    rezultat["durata"] = time.perf_counter() - start
+    print(f"{label}: {rezultat['status']} în {rezultat['durata']:.1f} s")
+    return indicator_id, rezultat
+
+
+def fetch_all(max_workers=MAX_WORKERS, indicator_ids=None, force=False):
+    """
+    Rulează scraper-ele în paralel, cu un număr limitat de fire de execuție,
+    astfel încât o actualizare completă durează cât cea mai lentă pagină, nu suma lor.
+    O eroare la un indicator nu le oprește pe celelalte.
+    :param max_workers: Numărul maxim de scraper-e rulate simultan
+    :param indicator_ids: Indicatorii actualizați (implicit toți din INDICATORS)
+    :param force: Transmis lui fetch_indicator: parsează paginile chiar dacă par neschimbate
+    :return: Dicționar {id indicator: {"label", "status": "actualizat" | "fără date noi" | "eroare", "eroare": mesaj sau None, "durata": secunde}}
+    """
+    indicator_ids = [indicator_id for indicator_id in INDICATORS if indicator_ids is None or indicator_id in indicator_ids]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_scraper, indicator_id, force) for indicator_id in indicator_ids]
+        raport = dict(future.result() for future in as_completed(futures))
+    return {indicator_id: raport[indicator_id] for indicator_id in indicator_ids}
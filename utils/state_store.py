@@ -0,0 +1,125 @@
+"""
+Stocarea stării scraper-elor (data/ultima_actualizare_*.json).
+
+- Scrierea este atomică: JSON-ul este scris într-un fișier temporar din același director, care apoi
+  înlocuiește fișierul vechi, astfel încât o pagină nu citește niciodată un fișier scris pe jumătate.
+- locked(path) serializează actualizările aceluiași fișier între fire și între procese (aplicația și
+  python -m utils.refresher), printr-un fișier <path>.lock blocat la nivelul sistemului de operare.
+- Citirile sunt păstrate în memorie după versiunea fișierului (mtime, dimensiune, inode), așa că un JSON
+  neschimbat nu este parsat de două ori.
+"""
+import json
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# path -> (versiunea fișierului, starea citită)
+_cache = {}
+_cache_lock = threading.Lock()
+
+# Permisiunile unui fișier de stare nou; un fișier existent își păstrează permisiunile
+STATE_FILE_MODE = 0o644
+
+# path -> lock-ul firelor din procesul curent
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def state_version(path):
+    """Versiunea fișierului de stare: (mtime, dimensiune, inode) sau None dacă fișierul nu există."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def read_state(path):
+    """
+    Starea salvată în path ({} dacă fișierul nu există). Rezultatul este partajat între apelanți
+    prin cache, deci nu trebuie modificat pe loc.
+    """
+    version = state_version(path)
+    if version is None:
+        return {}
+    with _cache_lock:
+        cached = _cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    with _cache_lock:
+        _cache[path] = (version, data)
+    return data
+
+
+def write_state(path, data):
+    """Scrie starea atomic și o păstrează în cache, ca următoarea citire să nu mai parseze fișierul."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = STATE_FILE_MODE
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        # mkstemp creează fișierul cu 0600, iar os.replace ar păstra aceste permisiuni
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    with _cache_lock:
+        _cache[path] = (state_version(path), data)
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK renunță după ~10 s; continuăm să așteptăm ca fcntl.flock
+            continue
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def locked(path):
+    """
+    Acces exclusiv la fișierul de stare pentru o secvență citire – comparație – scriere.
+    Cititorii nu au nevoie de lock: scrierea atomică le garantează un fișier complet.
+    """
+    with _locks_guard:
+        thread_lock = _locks.setdefault(path, threading.Lock())
+    with thread_lock:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with open(path + ".lock", "a+b") as f:
+            _lock_file(f)
+            try:
+                yield
+            finally:
+                _unlock_file(f)
@@ -0,0 +1,119 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+MEASURES = ["Exporturi (mil. $)", "Importuri (mil. $)", "Sold Comercial (mil. $)"]
+
+# Filtrele din bara laterală a paginii Sectorul Extern
+FILTER_DIMS = ["An", "Lună", "Țară", "Grupă Țări"]
+
+# Dimensiunile după care se poate agrega cubul
+CUBE_DIMS = ["An", "Lună", "Trimestru", "Semestru", "Țară", "Grupă Țări"]
+
+# Eticheta "Perioadă" afișată pe pagină pentru fiecare tip de perioadă: (dimensiune, format)
+PERIOD_LABELS = {
+    "Trimestrial": ("Trimestru", "{year}-Q{value}"),
+    "Semestrial": ("Semestru", "{year}-S{value}"),
+    "Anual": ("An", "{year}"),
+}
+
+_EMPTY = np.array([], dtype=np.intp)
+
+
+def _as_tuple(key):
+    return key if isinstance(key, tuple) else (key,)
+
+
+def _positions(df, keys):
+    """{(valori chei...): pozițiile rândurilor} pentru fiecare combinație de valori prezentă în df."""
+    if not keys:
+        return {(): np.arange(len(df))}
+    groups = df.groupby(keys, observed=True, sort=False).indices
+    return {_as_tuple(key): positions for key, positions in groups.items()}
+
+
+def _aggregate(df, keys, by):
+    """
+    Agregă indicatorii după keys + by o singură dată.
+    :return: (cadrul agregat cu coloanele by + MEASURES, pozițiile rândurilor pentru fiecare cheie)
+    """
+    # Când filtrul este chiar dimensiunea agregată (ex. grupul de țări), nu o repetăm în grupare
+    group_keys = keys + [col for col in by if col not in keys]
+    if group_keys:
+        summed = df.groupby(group_keys, observed=True)[MEASURES].sum().reset_index()
+    else:
+        summed = df[MEASURES].sum().to_frame().T
+    return summed[by + MEASURES], _positions(summed, keys)
+
+
+class TradeIndex:
+    """
+    Cub OLAP peste foaia Start_Data, construit o singură dată per versiune a fișierului.
+    Fiecare agregare (cuboid) este calculată la prima cerere, cu pozițiile rândurilor pentru fiecare
+    combinație de filtre (an × lună × țară × grup), și apoi doar consultată, astfel încât o selecție nouă
+    din bara laterală devine o căutare într-un dicționar.
+    """
+
+    def __init__(self, df):
+        df = df.astype({"An": "int"})
+        # Conversia la numeric se face o singură dată, nu la fiecare rerulare a paginii
+        for col in MEASURES:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+        self.frame = df
+
+        # Opțiunile din bara laterală
+        self.years = sorted(df["An"].unique().tolist(), reverse=True)
+        self.countries = df["Țară"].unique().tolist()
+        self.periods = df["Lună"].unique().tolist()
+
+        # (dimensiuni filtrate, dimensiuni agregate) -> cuboid
+        self._cuboids = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _filters(year, period, country, group):
+        filters = {"An": year, "Lună": period, "Țară": country, "Grupă Țări": group}
+        dims = tuple(dim for dim in FILTER_DIMS if filters[dim] is not None)
+        return dims, tuple(filters[dim] for dim in dims)
+
+    def _cuboid(self, dims, by):
+        key = (dims, by)
+        cuboid = self._cuboids.get(key)
+        if cuboid is None:
+            with self._lock:
+                cuboid = self._cuboids.get(key)
+                if cuboid is None:
+                    cuboid = _aggregate(self.frame, list(dims), list(by))
+                    self._cuboids[key] = cuboid
+        return cuboid
+
+    def totals(self, by, year=None, period=None, country=None, group=None):
+        """
+        Totalurile indicatorilor agregate după dimensiunile cerute, pentru selecția dată.
+        :param by: Dimensiunile din CUBE_DIMS după care se agregă (listă goală pentru totalul selecției)
+        :param year, period, country, group: Filtrele selecției; None înseamnă "Toate"
+        :return: DataFrame cu coloanele by + MEASURES, ordonat după dimensiunile agregate
+        """
+        unknown = [dim for dim in by if dim not in CUBE_DIMS]
+        if unknown:
+            raise ValueError(f"Dimensiuni necunoscute pentru cub: {unknown}")
+        dims, values = self._filters(year, period, country, group)
+        summed, positions = self._cuboid(dims, tuple(by))
+        return summed.iloc[positions.get(values, _EMPTY)].reset_index(drop=True)
+
+    def period_totals(self, year, period_type="Lunară", country=None, group=None):
+        """Totalurile pe perioadele anului (lunar, trimestrial, semestrial sau anual), cu eticheta în "Perioadă"."""
+        if period_type == "Lunară":
+            totals = self.totals(["Lună"], year=year, country=country, group=group)
+            return totals.rename(columns={"Lună": "Perioadă"})
+
+        dim, label = PERIOD_LABELS[period_type]
+        totals = self.totals([dim], year=year, country=country, group=group)
+        totals.insert(0, "Perioadă", [label.format(year=year, value=value) for value in totals.pop(dim)])
+        return totals
+
+    def top(self, measure, n, year, period=None, country=None, group=None):
+        """Primele n țări după indicatorul dat, pentru selecția dată."""
+        totals = self.totals(["Țară"], year=year, period=period, country=country, group=group)
+        return totals.sort_values(by=measure, ascending=False).head(n)